@@ -22,7 +22,7 @@ except ImportError:
     MUTAGEN_AVAILABLE = False
 
 # Reuse audio extensions from other modules
-AUDIO_EXTS = {".mp3", ".m4a", ".flac", ".wav", ".aiff", ".aif", ".ogg", ".opus", ".alac"}
+AUDIO_EXTS = frozenset({".mp3", ".m4a", ".flac", ".wav", ".aiff", ".aif", ".ogg", ".opus", ".alac"})
 
 # Common image extensions for album artwork
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
@@ -42,8 +42,9 @@ def _norm_for_matching(s: str) -> str:
     if s is None:
         return ""
     
-    # Normalize unicode (e.g., "I'll" → "I'll" in many cases)
-    s = unicodedata.normalize("NFKD", s)
+    # Normalize unicode (e.g., "I'll" → "I'll" in many cases); ASCII is already NFKD
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
     s = s.lower()
     
     # Remove common featuring patterns from titles/artists
@@ -1,26 +1,52 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-AUDIO_EXTS = {".mp3", ".m4a", ".flac", ".wav", ".aiff", ".aif", ".ogg", ".opus", ".alac"}
+# Same library walk rules (audio extensions, skipped folders, hidden files) as the matcher
+from match_playlist_to_library import has_audio_ext, is_skipped
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+
+# Precompiled patterns (these run several times per indexed file and per playlist track)
+_RE_FEAT_PAREN = re.compile(r"\s*\(feat\.?.*?\)")
+_RE_FEAT_BRACKET = re.compile(r"\s*\[feat\.?.*?\]")
+_RE_FEAT_TRAIL = re.compile(r"\s*feat\.?\s+.*$")
+_RE_PUNCT = re.compile(r"[^a-z0-9\s]")
+_RE_WS = re.compile(r"\s+")
+_RE_TRACKNUM = re.compile(r'^\d+\.?\s+')
+_RE_LEADING_SEP = re.compile(r'^[-\s]+')
+_RE_SEP = re.compile(r'\s*-\s*|\s*–\s*|\s*—\s*')
+_RE_ALBUM_SUFFIX = re.compile(r'\s*-\s*(single|ep|album|lp)\s*$', flags=re.IGNORECASE)
+_RE_YEAR = re.compile(r'\s*[\[\(]\d{4}[\]\)]\s*$')
+
+
+@lru_cache(maxsize=65536)
 def _norm(s: str) -> str:
     """Normalize for matching (casefold, strip punctuation, normalize quotes, remove feat.)."""
     if not s:
         return ""
-    s = unicodedata.normalize("NFKD", s).lower()
-    s = re.sub(r"\s*\(feat\.?.*?\)", "", s)
-    s = re.sub(r"\s*\[feat\.?.*?\]", "", s)
-    s = re.sub(r"\s*feat\.?\s+.*$", "", s)
+    if not s.isascii():  # ASCII is already NFKD
+        s = unicodedata.normalize("NFKD", s)
+    s = s.lower()
+    if "feat" in s:  # all three patterns need it; most names never get here
+        s = _RE_FEAT_PAREN.sub("", s)
+        s = _RE_FEAT_BRACKET.sub("", s)
+        s = _RE_FEAT_TRAIL.sub("", s)
     s = s.replace("&", "and")
-    s = re.sub(r"[^a-z0-9\s]", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _RE_PUNCT.sub("", s)
+    s = _RE_WS.sub(" ", s).strip()
     return s
 
 
@@ -35,11 +61,27 @@ def _safe_filename(s: str, max_len: int = 180) -> str:
 
 
 def _iter_audio_files(library_root: Path):
-    for p in library_root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in AUDIO_EXTS:
-            yield p
-
-
+    stack = [str(library_root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_skipped(entry.name, is_dir):
+                continue
+            if is_dir:
+                subdirs.append(entry.path)
+            elif has_audio_ext(entry.name) and entry.is_file():
+                yield Path(entry.path)
+        # Pre-order walk: the first subdirectory is searched next, like rglob
+        stack.extend(reversed(subdirs))
+
+
+@lru_cache(maxsize=65536)
 def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     """
     Try to extract just the track name from a filename that might include artist name or track numbers.
@@ -56,19 +98,19 @@ def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     norm_artist = _norm(artist)
     
     # Remove track numbers at the start (e.g., "02. BIG" -> "BIG")
-    norm_stem = re.sub(r'^\d+\.?\s+', '', norm_stem)
+    norm_stem = _RE_TRACKNUM.sub('', norm_stem)
     
     # If filename starts with artist name, try to remove it
     if norm_stem.startswith(norm_artist):
         # Try "Artist - Track" or "Artist-Track" pattern
         remaining = norm_stem[len(norm_artist):].strip()
         # Remove leading dash/hyphen/separator
-        remaining = re.sub(r'^[-\s]+', '', remaining)
+        remaining = _RE_LEADING_SEP.sub('', remaining)
         if remaining:
             return remaining
     
     # Also try splitting on common separators
-    parts = re.split(r'\s*-\s*|\s*–\s*|\s*—\s*', norm_stem)
+    parts = _RE_SEP.split(norm_stem)
     if len(parts) > 1:
         # If first part matches artist, return second part
         if _norm(parts[0]) == norm_artist and len(parts) > 1:
@@ -79,6 +121,7 @@ def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     return norm_stem
 
 
+@lru_cache(maxsize=65536)
 def _normalize_album_name(album: str) -> str:
     """
     Normalize album name by removing common suffixes/patterns that vary.
@@ -96,10 +139,10 @@ def _normalize_album_name(album: str) -> str:
     
     # Remove common suffixes BEFORE normalization (to preserve punctuation)
     # Remove "- Single", "- EP", etc.
-    album = re.sub(r'\s*-\s*(single|ep|album|lp)\s*$', '', album, flags=re.IGNORECASE)
+    album = _RE_ALBUM_SUFFIX.sub('', album)
     
     # Remove year patterns like "(2023)" or "[2023]"
-    album = re.sub(r'\s*[\[\(]\d{4}[\]\)]\s*$', '', album)
+    album = _RE_YEAR.sub('', album)
     
     # Now normalize
     return _norm(album).strip()
@@ -155,6 +198,15 @@ def _build_index(library_root: Path) -> Dict[Tuple[str, str, str], List[Path]]:
     return index
 
 
+def _write_manifest(manifest: Dict[str, Any], path: Path) -> None:
+    """Write the export manifest as indented JSON (orjson when available, else stdlib json)."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+
 def _pick_best_candidate(song: str, candidates: List[Path]) -> Optional[Path]:
     """
     Pick the best candidate among same-artist+album candidates.
@@ -345,14 +397,8 @@ def export_playlist_copies(
                 if matches:
                     break
         
-        # Remove duplicates
-        seen = set()
-        unique_matches = []
-        for p in matches:
-            if p not in seen:
-                seen.add(p)
-                unique_matches.append(p)
-        matches = unique_matches
+        # Remove duplicates (order-preserving)
+        matches = list(dict.fromkeys(matches))
 
         chosen: Optional[Path] = None
         match_type = None
@@ -415,7 +461,6 @@ def export_playlist_copies(
     }
 
     # Write manifest alongside the copied files
-    with open(dest_folder / "manifest.json", "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    _write_manifest(manifest, dest_folder / "manifest.json")
 
     return manifest
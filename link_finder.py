@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 import time
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # ----------------------------
@@ -25,16 +29,28 @@ SLEEP_BETWEEN_CALLS = 0.25
 # Optional disk cache to avoid re-querying the same tracks repeatedly
 CACHE_PATH = Path("link_cache.json")
 
+# Cached lookups older than this are re-fetched (links and catalog availability change)
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Connection pool size for sessions from create_session (>= concurrent lookup threads)
+POOL_SIZE = 16
+
+# Serializes cache writes when lookups run on several threads with a shared cache dict
+_CACHE_LOCK = threading.Lock()
+
 
 # ----------------------------
 # Helpers: normalization + scoring
 # ----------------------------
 
+@lru_cache(maxsize=4096)
 def _norm(s: str) -> str:
     """Normalize for matching and scoring."""
     if not s:
         return ""
-    s = unicodedata.normalize("NFKD", s).lower()
+    if not s.isascii():  # ASCII is already NFKD
+        s = unicodedata.normalize("NFKD", s)
+    s = s.lower()
 
     # Remove featuring parts that often differ across services
     s = re.sub(r"\s*\(feat\.?.*?\)", "", s)
@@ -92,6 +108,27 @@ class TrackMeta:
     album: Optional[str] = None
 
 
+# ----------------------------
+# HTTP session
+# ----------------------------
+
+def create_session() -> requests.Session:
+    """
+    Session for the link APIs: pooled keep-alive connections, and retries with backoff
+    on connection errors, rate limiting (429) and transient 5xx responses.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
 # ----------------------------
 # Cache (optional but useful)
 # ----------------------------
@@ -106,7 +143,17 @@ def load_cache(path: Path = CACHE_PATH) -> Dict[str, Any]:
 
 
 def save_cache(cache: Dict[str, Any], path: Path = CACHE_PATH) -> None:
-    path.write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding="utf-8")
+    with _CACHE_LOCK:
+        # Snapshot first: other lookup threads may be adding entries to the same dict
+        snapshot = dict(cache)
+        path.write_text(json.dumps(snapshot, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def cache_entry_is_fresh(entry: Optional[Dict[str, Any]]) -> bool:
+    """True if a cached lookup exists and is younger than CACHE_TTL_SECONDS."""
+    if not entry:
+        return False
+    return time.time() - entry.get("cached_at", 0) < CACHE_TTL_SECONDS
 
 
 def cache_key(track: TrackMeta) -> str:
@@ -412,16 +459,27 @@ def find_share_urls_from_metadata(
 
     Output is JSON-friendly and designed to be attached to your playlist track dict.
     """
+    # Every provider needs both fields; don't spend round trips on a guaranteed miss
+    if not (track.artist or "").strip() or not (track.title or "").strip():
+        return {
+            "ok": False,
+            "reason": "missing_metadata",
+            "track": {"artist": track.artist, "title": track.title, "album": track.album},
+            "seed": None,
+            "aggregated": None,
+            "targets": {},
+        }
+
     own_session = session is None
     if session is None:
-        session = requests.Session()
+        session = create_session()
 
     try:
         if cache is None and use_cache:
             cache = load_cache()
 
         key = cache_key(track)
-        if use_cache and cache is not None and key in cache:
+        if use_cache and cache is not None and cache_entry_is_fresh(cache.get(key)):
             return cache[key]
 
         # 1) Seed lookup
@@ -437,6 +495,7 @@ def find_share_urls_from_metadata(
                 "seed": None,
                 "aggregated": None,
                 "targets": {},
+                "cached_at": time.time(),
             }
             if use_cache and cache is not None:
                 cache[key] = result
@@ -485,6 +544,7 @@ def find_share_urls_from_metadata(
             "album_aggregated": {
                 "targets": album_targets,
             } if album_targets else None,
+            "cached_at": time.time(),
         }
 
         if use_cache and cache is not None:
@@ -507,7 +567,7 @@ def enrich_playlist_with_links(playlist_data: Dict[str, Any]) -> Dict[str, Any]:
     Takes your playlist_scraper output dict and adds share links for each track:
       track["share_links"] = {...}
     """
-    s = requests.Session()
+    s = create_session()
     cache = load_cache()
 
     try:
@@ -8,30 +8,62 @@ This script provides an interactive workflow to:
 3. Create a playlist folder with numbered tracks
 """
 
+import argparse
+import atexit
 import json
+import operator
+import os
 import re
+import shlex
 import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
 from tqdm import tqdm
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from scraper import playlist_scraper
-from match_playlist_to_library import match_playlist_to_library
+from match_playlist_to_library import match_playlist_to_library, warm_index_cache
 from create_playlist import export_playlist_copies
-from link_finder import TrackMeta, find_share_urls_from_metadata
-from catalog_music import catalog_music
+from link_finder import TrackMeta, cache_key, create_session, find_share_urls_from_metadata, load_cache
 
 
 # ----------------------------
 # Artifacts and JSON utilities
 # ----------------------------
 
-ARTIFACTS_DIR = Path("artifacts")
+# SPINDLE_ARTIFACTS_DIR relocates artifacts (e.g. one directory per test worker or per project)
+ARTIFACTS_DIR = Path(os.environ.get("SPINDLE_ARTIFACTS_DIR", "artifacts"))
 SETTINGS_FILE = Path("spindle_settings.json")
 
+# Playlist artifacts scraped from the same URL within this window can be reused instead of re-scraping
+SCRAPE_REUSE_MAX_AGE = 3600
+
+# When True, prompts return their default without waiting on input() (set by --yes)
+ASSUME_YES = False
+
+# Offer the $EDITOR checklist in confirm_skip_tracks when more tracks than this are still missing
+EDITOR_BATCH_THRESHOLD = 10
+_EDITOR_MARK_RE = re.compile(r"^\[[xX]\]\s*(\d+)\.")
+
+# Concurrent link lookups (kept small to stay polite to the Deezer/iTunes/Odesli APIs)
+LINK_LOOKUP_WORKERS = 4
+
+# One long-lived session so repeated lookups in a run reuse TCP/TLS connections
+# (created on first use, so importing main stays cheap)
+_link_session = None
+
 
 # ----------------------------
 # Settings management
@@ -150,6 +182,17 @@ def set_setting(key_path: str, value: any) -> None:
     save_settings(settings)
 
 
+_SLUG_SEP_RE = re.compile(r'[\s_/]+')
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9-]')
+_SLUG_DASHES_RE = re.compile(r'-+')
+# ASCII text needs no regex: one bytes.translate maps separators to "-" and deletes
+# everything else _SLUG_STRIP_RE would remove (input is already lowercased)
+_SLUG_ASCII_TABLE = bytes(ord("-") if _SLUG_SEP_RE.match(chr(c)) else c for c in range(256))
+_SLUG_ASCII_DELETE = bytes(
+    c for c in range(128) if _SLUG_STRIP_RE.match(chr(c)) and not _SLUG_SEP_RE.match(chr(c))
+)
+
+
 def safe_slug(text: str) -> str:
     """
     Convert text to a filesystem-safe slug.
@@ -166,14 +209,18 @@ def safe_slug(text: str) -> str:
     # Normalize to lowercase
     slug = text.lower()
     
-    # Replace spaces and common separators with dashes
-    slug = re.sub(r'[\s_]+', '-', slug)
-    
-    # Keep only alphanumeric and dashes
-    slug = re.sub(r'[^a-z0-9-]', '', slug)
+    if slug.isascii():
+        # Replace separators with dashes and drop other punctuation in one pass
+        slug = slug.encode("ascii").translate(_SLUG_ASCII_TABLE, _SLUG_ASCII_DELETE).decode("ascii")
+    else:
+        # Replace spaces and common separators with dashes
+        slug = _SLUG_SEP_RE.sub('-', slug)
+        
+        # Keep only alphanumeric and dashes
+        slug = _SLUG_STRIP_RE.sub('', slug)
     
     # Collapse multiple dashes
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_DASHES_RE.sub('-', slug)
     
     # Strip leading/trailing dashes
     slug = slug.strip('-')
@@ -293,6 +340,9 @@ def load_json(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"JSON file not found: {path}")
     
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch it unchanged
+        return orjson.loads(path.read_bytes())
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -310,8 +360,12 @@ def save_json(obj: dict, path: Path) -> Path:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        # Same layout as json.dump(indent=2, ensure_ascii=False); non-str keys are stringified like json does
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
     
     return path
 
@@ -354,7 +408,15 @@ def prompt_user(prompt: str, default: str = None) -> str:
     Prompt user for input with optional default value.
     
     Returns the user's input (or default if provided and user just presses Enter).
+    In non-interactive mode (--yes), the default is returned without prompting;
+    a prompt without a default exits with an error instead of looping.
     """
+    if ASSUME_YES:
+        if default is not None:
+            return default
+        print(f"Error: {prompt} - a value is required in --yes mode.")
+        sys.exit(1)
+    
     if default:
         full_prompt = f"{prompt} [{default}]: "
     else:
@@ -373,8 +435,11 @@ def prompt_yes_no(prompt: str, default: bool = True) -> bool:
         default: Default value if user just presses Enter
     
     Returns:
-        True for yes, False for no
+        True for yes, False for no (the default in non-interactive mode)
     """
+    if ASSUME_YES:
+        return default
+    
     default_str = "Y/n" if default else "y/N"
     response = input(f"{prompt} [{default_str}]: ").strip().lower()
     
@@ -428,6 +493,29 @@ def get_library_path() -> tuple[str, str]:
     return str(base_path), subpath
 
 
+def resolve_library_root(base_folder: str, library_subpath: str) -> Path:
+    """
+    Resolve the library root once so a workflow can share it instead of re-resolving.
+    
+    Args:
+        base_folder: Base folder containing the library
+        library_subpath: Subpath to the library within base_folder ("" if base IS the library)
+    
+    Returns:
+        Resolved library root path (exits if it does not exist)
+    """
+    library_root = Path(base_folder)
+    if library_subpath:
+        library_root = library_root / library_subpath
+    library_root = library_root.resolve()
+    
+    if not library_root.exists():
+        print(f"Error: Library root does not exist: {library_root}")
+        sys.exit(1)
+    
+    return library_root
+
+
 def print_track_list(tracks: list[dict], title: str = "TRACK LIST") -> None:
     """
     Print a formatted list of tracks.
@@ -563,78 +651,169 @@ def print_album_links_summary(tracks: list[dict], title: str = "ALBUM LINKS SUMM
     print()
 
 
-def display_missing_tracks(match_result: dict) -> list[dict]:
+def _get_link_session() -> requests.Session:
+    """Return the shared link-lookup session, creating it (and its exit-time close) on first use."""
+    global _link_session
+    if _link_session is None:
+        _link_session = create_session()
+        atexit.register(_link_session.close)
+    return _link_session
+
+
+def _fetch_links(track: dict, session: requests.Session, cache: dict) -> dict:
+    """
+    Look up share links for a single match-result track.
+    
+    Returns:
+        The find_share_urls_from_metadata result, or None if the lookup raised
+    """
+    try:
+        track_meta = TrackMeta(
+            artist=track.get('artist', ''),
+            title=track.get('song', ''),
+            album=track.get('album')
+        )
+        return find_share_urls_from_metadata(
+            track_meta,
+            session=session,
+            use_cache=True,
+            cache=cache
+        )
+    except Exception:
+        return None
+
+
+def _amazon_links(link_result: dict) -> tuple:
+    """
+    Pull the Amazon Music track and album links out of a link lookup result.
+    
+    Returns:
+        Tuple of (track_link, album_link), None where unavailable
+    """
+    try:
+        track_amazon = link_result['aggregated']['targets']['amazon_music']
+    except (KeyError, TypeError):
+        track_amazon = None
+    try:
+        album_amazon = link_result['album_aggregated']['targets']['amazon_music']
+    except (KeyError, TypeError):
+        album_amazon = None
+    return track_amazon, album_amazon
+
+
+def _link_key(track: dict) -> tuple:
+    """Key identifying a track's link lookup (same fields that go into TrackMeta)."""
+    return (track.get('artist', ''), track.get('song', ''), track.get('album'))
+
+
+def iter_links_for_tracks(tracks: list[dict], session: requests.Session):
+    """
+    Look up share links for many tracks concurrently, yielding results in input order.
+    
+    All lookups are submitted up front, so callers can print track N while the
+    lookups for later tracks are still running in the background. Duplicate
+    tracks are looked up once.
+    
+    Args:
+        tracks: Match-result track dicts (artist/song/album)
+        session: Shared requests session
+    
+    Yields:
+        Link result for each track (None where a lookup failed)
+    """
+    cache = load_cache()
+    executor = ThreadPoolExecutor(max_workers=LINK_LOOKUP_WORKERS)
+    # Repeated plays of the same track share one lookup (keyed like the link cache)
+    futures = {}
+    try:
+        keys = []
+        for track in tracks:
+            key = cache_key(TrackMeta(
+                artist=track.get('artist', ''),
+                title=track.get('song', ''),
+                album=track.get('album')
+            ))
+            if key not in futures:
+                futures[key] = executor.submit(_fetch_links, track, session, cache)
+            keys.append(key)
+        
+        for key in keys:
+            yield futures[key].result()
+    finally:
+        # If the consumer stops early (error, Ctrl-C, close()), drop the queued lookups
+        # instead of blocking until every one has hit the network
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def fetch_links_for_tracks(tracks: list[dict], session: requests.Session) -> list[dict]:
+    """
+    Look up share links for many tracks concurrently.
+    
+    Returns:
+        Link results in the same order as tracks (None where a lookup failed)
+    """
+    return list(iter_links_for_tracks(tracks, session))
+
+
+def display_missing_tracks(match_result: dict) -> tuple[list[dict], dict]:
     """
     Display missing tracks and return list of missing track info.
     Includes Amazon Music links for tracks and albums when available.
     
     Returns:
-        List of track dictionaries that are missing
+        Tuple of (missing track dictionaries, link results keyed by _link_key)
+        so later prompts can reuse the lookups
     """
     missing = [r for r in match_result["results"] if r["match_status"] == "missing"]
     
     if not missing:
-        return []
+        return [], {}
     
     print_title(f"MISSING TRACKS ({len(missing)} of {match_result['summary']['total_tracks']})")
     print("Fetching Amazon Music links...")
     print()
     
-    # Create a session for API calls
-    session = requests.Session()
-    
-    try:
-        for i, track in enumerate(missing, 1):
-            print(f"{i}. {track['artist']} - {track['song']}")
-            if track.get('album'):
-                print(f"   Album: {track['album']}")
-            
-            # Fetch links for this track
-            try:
-                track_meta = TrackMeta(
-                    artist=track.get('artist', ''),
-                    title=track.get('song', ''),
-                    album=track.get('album')
-                )
-                link_result = find_share_urls_from_metadata(
-                    track_meta,
-                    session=session,
-                    use_cache=True
-                )
-                
-                # Display Amazon Music links if available
-                if link_result.get('ok'):
-                    # Track link
-                    track_amazon = link_result.get('aggregated', {}).get('targets', {}).get('amazon_music')
-                    if track_amazon:
-                        print(f"   Track: {track_amazon}")
-                    
-                    # Album link (derived from track link by removing query string)
-                    album_amazon = None
-                    if link_result.get('album_aggregated'):
-                        album_amazon = link_result.get('album_aggregated', {}).get('targets', {}).get('amazon_music')
-                    if album_amazon:
-                        print(f"   Album: {album_amazon}")
-                    
-                    # If no Amazon links found, indicate that
-                    if not track_amazon and not album_amazon:
-                        print(f"   (Amazon Music links not available)")
-                else:
-                    print(f"   (Could not find links)")
-            except Exception as e:
-                # Silently handle errors - just don't show links
-                print(f"   (Error fetching links)")
+    # Each track is printed as soon as its lookup lands; later ones keep fetching meanwhile
+    links_by_key = {}
+    link_results = iter_links_for_tracks(missing, _get_link_session())
+    
+    for i, (track, link_result) in enumerate(zip(missing, link_results), 1):
+        links_by_key[_link_key(track)] = link_result
+        
+        # Build each track's block and write it in one call
+        lines = [f"{i}. {track['artist']} - {track['song']}"]
+        if track.get('album'):
+            lines.append(f"   Album: {track['album']}")
+        
+        if link_result is None:
+            # Lookup failed - just don't show links
+            lines.append("   (Error fetching links)")
+        elif link_result.get('reason') == 'missing_metadata':
+            lines.append("   (Missing metadata, skipping lookup)")
+        elif link_result.get('ok'):
+            # Display Amazon Music links if available
+            track_amazon, album_amazon = _amazon_links(link_result)
+            if track_amazon:
+                lines.append(f"   Track: {track_amazon}")
+            if album_amazon:
+                lines.append(f"   Album: {album_amazon}")
             
-            if track.get('candidate_paths'):
-                print(f"   Candidates found:")
-                for path in track['candidate_paths'][:3]:  # Show first 3 candidates
-                    print(f"     - {Path(path).name}")
-            print()
-    
-    finally:
-        session.close()
+            # If no Amazon links found, indicate that
+            if not track_amazon and not album_amazon:
+                lines.append("   (Amazon Music links not available)")
+        else:
+            lines.append("   (Could not find links)")
+        
+        if track.get('candidate_paths'):
+            lines.append("   Candidates found:")
+            for path in track['candidate_paths'][:3]:  # Show first 3 candidates
+                lines.append(f"     - {os.path.basename(path)}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    return missing
+    return missing, links_by_key
 
 
 def create_artist_directories(missing_tracks: list[dict], library_root: Path) -> None:
@@ -664,24 +843,35 @@ def create_artist_directories(missing_tracks: list[dict], library_root: Path) ->
         print(f"  - {artist}")
     print()
     
-    if not prompt_yes_no("Create artist directories in library?", default=True):
+    # Headless runs never touch the library unasked
+    if not prompt_yes_no("Create artist directories in library?", default=not ASSUME_YES):
         return
     
+    # One directory listing tells us which artists already have folders
+    try:
+        with os.scandir(library_root) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        existing = set()
+    
     created = []
-    skipped = []
+    skipped = sorted(artists & existing)
     
-    for artist in sorted(artists):
+    for artist in sorted(artists - existing):
         artist_dir = library_root / artist
-        if artist_dir.exists():
-            skipped.append(artist)
-            continue
         
+        # mkdir still reports folders the listing missed (e.g. case-insensitive filesystems)
         try:
-            artist_dir.mkdir(parents=True, exist_ok=True)
-            created.append(artist)
-            print(f"✓ Created: {artist_dir}")
+            artist_dir.mkdir(parents=True)
+        except FileExistsError:
+            skipped.append(artist)
+            continue
         except Exception as e:
             print(f"✗ Error creating {artist_dir}: {e}")
+            continue
+        
+        created.append(artist)
+        print(f"✓ Created: {artist_dir}")
     
     print()
     if created:
@@ -755,20 +945,15 @@ def catalog_new_music(base_folder: str, library_subpath: str) -> None:
         if skip_duplicates != default_skip:
             set_setting("catalog.skip_duplicates", skip_duplicates)
     
-    # Calculate library root path
-    library_root_path = Path(base_folder)
-    if library_subpath:
-        library_root_path = library_root_path / library_subpath
-    library_root_path = library_root_path.resolve()
-    
-    if not library_root_path.exists():
-        print(f"Error: Library root does not exist: {library_root_path}")
-        sys.exit(1)
+    library_root_path = resolve_library_root(base_folder, library_subpath)
     
     print()
     print("Scanning for audio files...")
     
     try:
+        # Imported here: only this workflow needs catalog_music (and mutagen behind it)
+        from catalog_music import catalog_music
+        
         result = catalog_music(
             drop_location=str(drop_path),
             library_root=str(library_root_path),
@@ -798,7 +983,9 @@ def catalog_new_music(base_folder: str, library_subpath: str) -> None:
         if cataloged_files:
             print("Sample of cataloged files:")
             for item in cataloged_files[:5]:
-                print(f"  ✓ {Path(item['source_path']).name} → {Path(item['destination_path']).relative_to(library_root_path)}")
+                source_name = os.path.basename(item['source_path'])
+                dest_rel = os.path.relpath(item['destination_path'], library_root_path)
+                print(f"  ✓ {source_name} → {dest_rel}")
             if len(cataloged_files) > 5:
                 print(f"  ... and {len(cataloged_files) - 5} more")
             print()
@@ -817,94 +1004,202 @@ def catalog_new_music(base_folder: str, library_subpath: str) -> None:
         sys.exit(1)
 
 
-def confirm_skip_tracks(still_missing: list[dict]) -> list[dict]:
+def _select_tracks_in_editor(tracks: list[dict]):
+    """
+    Let the user tick tracks in $EDITOR, one "[ ] N. Artist - Song" line per track.
+    
+    Returns:
+        1-based indices of the lines marked "[x]", or None if the editor could not be
+        run, failed, or the checklist was left unchanged (caller falls back to the prompt)
+    """
+    header = ("# Mark tracks to KEEP with [x] (keeping any cancels the operation).\n"
+              "# Leave everything unmarked to skip all of them. Save and quit when done.\n")
+    checklist = header + "".join(
+        f"[ ] {i}. {track.get('artist', 'Unknown')} - {track.get('song', 'Unknown')}\n"
+        for i, track in enumerate(tracks, 1)
+    )
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", prefix="spindle_keep_",
+                                     delete=False, encoding="utf-8") as f:
+        f.write(checklist)
+        path = f.name
+    
+    try:
+        # $EDITOR may carry arguments, e.g. "code --wait"
+        editor = shlex.split(os.environ.get("EDITOR", "vi")) or ["vi"]
+        try:
+            returncode = subprocess.call(editor + [path])
+        except OSError as e:
+            print(f"Could not start editor: {e}")
+            return None
+        if returncode != 0:
+            print(f"Editor exited with status {returncode}.")
+            return None
+        with open(path, encoding="utf-8") as f:
+            edited = f.read()
+        if edited == checklist:
+            # Quit without saving looks the same as "nothing marked"; don't read it as skip-all
+            return None
+        marked = (_EDITOR_MARK_RE.match(line) for line in edited.splitlines())
+        return {int(m.group(1)) for m in marked if m}
+    finally:
+        os.unlink(path)
+
+
+def _parse_track_numbers(response: str, count: int):
+    """
+    Parse a comma-separated list of 1-based track numbers.
+    
+    Returns:
+        Set of numbers (empty for a blank answer), or None if any entry is not
+        a number between 1 and count
+    """
+    numbers = set()
+    for token in response.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if not token.isdigit() or not 1 <= int(token) <= count:
+            return None
+        numbers.add(int(token))
+    return numbers
+
+
+def confirm_skip_tracks(still_missing: list[dict], links_by_key: dict = None) -> list[dict]:
     """
-    Ask user to confirm skipping each track that still can't be found.
+    Ask user which tracks that still can't be found should be kept, in a single prompt.
     Includes Amazon Music links for tracks and albums when available.
     
     Args:
         still_missing: List of tracks that are still missing after re-matching
+        links_by_key: Link results already fetched by display_missing_tracks;
+            only tracks not in it are looked up again
     
     Returns:
-        List of tracks that user confirmed to skip
+        List of tracks that user confirmed to skip, or None if any track was kept
+        (operation should be cancelled)
     """
     if not still_missing:
         return []
     
     print_title("CONFIRM SKIPPING TRACKS")
     print(f"The following {len(still_missing)} tracks still cannot be found:")
-    print("You can choose to skip each track or cancel the operation.")
     print()
     
-    tracks_to_skip = []
-    tracks_to_keep = []
+    links_by_key = dict(links_by_key or {})
+    to_fetch = [t for t in still_missing if _link_key(t) not in links_by_key]
+    if to_fetch:
+        for t, r in zip(to_fetch, fetch_links_for_tracks(to_fetch, _get_link_session())):
+            links_by_key[_link_key(t)] = r
+    
+    lines = []
+    for i, track in enumerate(still_missing, 1):
+        link_result = links_by_key.get(_link_key(track))
+        artist = track.get('artist', 'Unknown')
+        song = track.get('song', 'Unknown')
+        album = track.get('album', '')
+        
+        lines.append(f"{i}. {artist} - {song}")
+        if album:
+            lines.append(f"    Album: {album}")
+        
+        # Display Amazon Music links if available (failed lookups just show no links)
+        if link_result and link_result.get('ok'):
+            track_amazon, album_amazon = _amazon_links(link_result)
+            if track_amazon:
+                lines.append(f"    Track: {track_amazon}")
+            if album_amazon:
+                lines.append(f"    Album: {album_amazon}")
+    
+    # Everything is already fetched, so write the whole list in one call
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    # Create a session for API calls
-    session = requests.Session()
-    
-    try:
-        for i, track in enumerate(still_missing, 1):
-            artist = track.get('artist', 'Unknown')
-            song = track.get('song', 'Unknown')
-            album = track.get('album', '')
-            
-            print(f"{i}/{len(still_missing)}. {artist} - {song}")
-            if album:
-                print(f"    Album: {album}")
-            
-            # Fetch links for this track
-            try:
-                track_meta = TrackMeta(
-                    artist=track.get('artist', ''),
-                    title=track.get('song', ''),
-                    album=track.get('album')
-                )
-                link_result = find_share_urls_from_metadata(
-                    track_meta,
-                    session=session,
-                    use_cache=True
-                )
-                
-                # Display Amazon Music links if available
-                if link_result.get('ok'):
-                    # Track link
-                    track_amazon = link_result.get('aggregated', {}).get('targets', {}).get('amazon_music')
-                    if track_amazon:
-                        print(f"    Track: {track_amazon}")
-                    
-                    # Album link (derived from track link by removing query string)
-                    album_amazon = None
-                    if link_result.get('album_aggregated'):
-                        album_amazon = link_result.get('album_aggregated', {}).get('targets', {}).get('amazon_music')
-                    if album_amazon:
-                        print(f"    Album: {album_amazon}")
-            except Exception:
-                # Silently handle errors - just don't show links
-                pass
-            
-            if prompt_yes_no("    Skip this track?", default=False):
-                tracks_to_skip.append(track)
-                print("    → Will be skipped")
-            else:
-                tracks_to_keep.append(track)
-                print("    → Will be kept (operation will be cancelled)")
-            print()
+    print()
+    keep_idxs = None
+    if (len(still_missing) > EDITOR_BATCH_THRESHOLD
+            and prompt_yes_no("Mark tracks to keep in your editor instead?", default=False)):
+        keep_idxs = _select_tracks_in_editor(still_missing)
+        if keep_idxs is None:
+            print("No selection was saved in the editor; answer here instead.")
+    if keep_idxs is None:
+        print("Enter the numbers of any tracks to KEEP (this cancels the operation),")
+        print("or leave blank to skip all of them.")
+        while True:
+            response = prompt_user("Tracks to keep (comma-separated)", "")
+            keep_idxs = _parse_track_numbers(response, len(still_missing))
+            if keep_idxs is not None:
+                break
+            # Never guess: a misread answer would silently skip tracks the user meant to keep
+            print(f"Error: enter comma-separated numbers from 1 to {len(still_missing)}, or leave blank.")
     
-    finally:
-        session.close()
+    tracks_to_skip = [t for i, t in enumerate(still_missing, 1) if i not in keep_idxs]
+    tracks_to_keep = len(still_missing) - len(tracks_to_skip)
     
     if tracks_to_keep:
-        print(f"⚠ {len(tracks_to_keep)} tracks will not be skipped.")
+        print(f"⚠ {tracks_to_keep} tracks will not be skipped.")
         print("Operation cancelled. Please add these tracks to your library and try again.")
         return None  # Signal to cancel
     
+    print(f"✓ All {len(tracks_to_skip)} tracks will be skipped")
     return tracks_to_skip
 
 
+def remove_skipped_tracks(playlist_data: dict, skipped_tracks: list[dict]) -> None:
+    """
+    Remove skipped tracks from playlist_data in place and update its track count.
+    
+    Tracks are matched on (artist, song); a missing field counts as an empty string.
+    
+    Args:
+        playlist_data: Scraped playlist data (meta + tracks)
+        skipped_tracks: Tracks (playlist or match-result entries) to drop
+    """
+    skipped_artists_songs = {(t.get('artist', ''), t.get('song', '')) for t in skipped_tracks}
+    original_tracks = playlist_data.get('tracks', [])
+    playlist_data['tracks'] = [
+        t for t in original_tracks
+        if (t.get('artist', ''), t.get('song', '')) not in skipped_artists_songs
+    ]
+    playlist_data['meta']['track_count'] = len(playlist_data['tracks'])
+    # Mark the artifact as edited so it is never reused as a fresh scrape
+    playlist_data['meta']['tracks_skipped'] = len(original_tracks) - len(playlist_data['tracks'])
+
+
 # ----------------------------
 # Stage functions
 # ----------------------------
 
+def find_recent_playlist_artifact(url: str, artifacts_dir: Path,
+                                  max_age: float = SCRAPE_REUSE_MAX_AGE) -> tuple[dict, Path]:
+    """
+    Find a playlist artifact scraped from url within max_age seconds.
+    
+    Playlists that had tracks skipped are ignored since they no longer match the page.
+    
+    Returns:
+        Tuple of (playlist_data, path), or (None, None) if there is no recent scrape
+    """
+    if not artifacts_dir.exists():
+        return None, None
+    
+    now = datetime.now().timestamp()
+    recent = []
+    for path in artifacts_dir.glob("*.playlist.json"):
+        mtime = path.stat().st_mtime
+        if now - mtime <= max_age:
+            recent.append((mtime, path))
+    
+    for _mtime, path in sorted(recent, reverse=True):
+        try:
+            playlist_data = load_json(path)
+        except (OSError, ValueError):
+            continue
+        meta = playlist_data.get("meta", {})
+        if meta.get("source_url") == url and not meta.get("tracks_skipped"):
+            return playlist_data, path
+    
+    return None, None
+
+
 def _scrape_and_prompt_name(url: str, artifacts_dir: Path, prompt_for_name: bool = True) -> tuple[dict, Path]:
     """
     Helper function to scrape a playlist and optionally prompt for a custom name.
@@ -918,6 +1213,17 @@ def _scrape_and_prompt_name(url: str, artifacts_dir: Path, prompt_for_name: bool
         Tuple of (playlist_data, output_path)
     """
     print_title("STAGE 1: SCRAPING PLAYLIST")
+    
+    # Reuse a recent scrape of the same URL (e.g. a rerun after adding tracks)
+    cached_data, cached_path = find_recent_playlist_artifact(url, artifacts_dir)
+    if cached_data is not None:
+        print(f"Found a recent scrape of this playlist: {cached_path.name}")
+        if prompt_yes_no("Use the saved playlist instead of re-scraping?", default=True):
+            print(f"✓ Using: {cached_path.resolve()}")
+            print()
+            return cached_data, cached_path
+        print()
+    
     print(f"Scraping: {url}")
     print("Please wait...")
     print()
@@ -1171,109 +1477,104 @@ def run_links(match_json_path: Path, artifacts_dir: Path, missing_only: bool = T
     print(f"Enriching {len(tracks_to_enrich)} track(s) with {service_display_name} links...")
     print()
     
-    session = requests.Session()
     links_found = 0
     tracks_without_links = []
     
-    try:
-        # Use tqdm to show progress bar
-        for track in tqdm(tracks_to_enrich, desc="Enriching tracks", unit="track"):
-            try:
-                track_meta = TrackMeta(
-                    artist=track.get('artist', ''),
-                    title=track.get('song', ''),
-                    album=track.get('album')
-                )
-                link_result = find_share_urls_from_metadata(
-                    track_meta,
-                    session=session,
-                    use_cache=True
-                )
+    # Use tqdm to show progress bar
+    for track in tqdm(tracks_to_enrich, desc="Enriching tracks", unit="track"):
+        try:
+            track_meta = TrackMeta(
+                artist=track.get('artist', ''),
+                title=track.get('song', ''),
+                album=track.get('album')
+            )
+            link_result = find_share_urls_from_metadata(
+                track_meta,
+                session=_get_link_session(),
+                use_cache=True
+            )
+            
+            # Attach link result to track, filtered by selected service
+            if link_result.get("ok"):
+                all_targets = link_result.get("aggregated", {}).get("targets", {})
                 
-                # Attach link result to track, filtered by selected service
-                if link_result.get("ok"):
-                    all_targets = link_result.get("aggregated", {}).get("targets", {})
-                    
+                # Filter to only include the selected service
+                filtered_targets = {}
+                if selected_service in all_targets and all_targets[selected_service]:
+                    filtered_targets[selected_service] = all_targets[selected_service]
+                
+                track["share_links"] = filtered_targets
+                track["songlink_page"] = link_result.get("aggregated", {}).get("page_url")
+                track["link_seed"] = link_result.get("seed")
+                
+                # Store album links if available (only Amazon Music currently supports this)
+                album_aggregated = link_result.get("album_aggregated", {})
+                if album_aggregated:
+                    album_targets = album_aggregated.get("targets", {})
                     # Filter to only include the selected service
-                    filtered_targets = {}
-                    if selected_service in all_targets and all_targets[selected_service]:
-                        filtered_targets[selected_service] = all_targets[selected_service]
-                    
-                    track["share_links"] = filtered_targets
-                    track["songlink_page"] = link_result.get("aggregated", {}).get("page_url")
-                    track["link_seed"] = link_result.get("seed")
-                    
-                    # Store album links if available (only Amazon Music currently supports this)
-                    album_aggregated = link_result.get("album_aggregated", {})
-                    if album_aggregated:
-                        album_targets = album_aggregated.get("targets", {})
-                        # Filter to only include the selected service
-                        filtered_album_targets = {}
-                        if selected_service in album_targets and album_targets[selected_service]:
-                            filtered_album_targets[selected_service] = album_targets[selected_service]
-                        track["album_share_links"] = filtered_album_targets
-                    else:
-                        track["album_share_links"] = {}
-                    
-                    if filtered_targets:
-                        links_found += 1
-                    else:
-                        # Track link lookup succeeded but no links found for selected service
-                        tracks_without_links.append(track)
+                    filtered_album_targets = {}
+                    if selected_service in album_targets and album_targets[selected_service]:
+                        filtered_album_targets[selected_service] = album_targets[selected_service]
+                    track["album_share_links"] = filtered_album_targets
                 else:
-                    track["share_links"] = {}
                     track["album_share_links"] = {}
-                    track["songlink_page"] = None
-                    track["link_seed"] = None
-                    # Track link lookup failed
+                
+                if filtered_targets:
+                    links_found += 1
+                else:
+                    # Track link lookup succeeded but no links found for selected service
                     tracks_without_links.append(track)
-            except Exception:
-                # Silently handle errors
+            else:
                 track["share_links"] = {}
                 track["album_share_links"] = {}
                 track["songlink_page"] = None
                 track["link_seed"] = None
-                # Track error during link lookup
+                # Track link lookup failed
                 tracks_without_links.append(track)
-        
-        # Extract stem from match JSON filename to maintain consistent naming
-        # The match file stem should match the playlist file stem
-        stem = extract_stem_from_artifact_path(match_json_path)
-        output_path = artifacts_dir / f"{stem}.enriched.json"
-        
-        # Save enriched match report
-        save_json(match_result, output_path)
-        
-        print()
-        print(f"✓ Found links for {links_found} of {len(tracks_to_enrich)} track(s)")
-        print(f"✓ Saved to: {output_path.resolve()}")
+        except Exception:
+            # Silently handle errors
+            track["share_links"] = {}
+            track["album_share_links"] = {}
+            track["songlink_page"] = None
+            track["link_seed"] = None
+            # Track error during link lookup
+            tracks_without_links.append(track)
+    
+    # Extract stem from match JSON filename to maintain consistent naming
+    # The match file stem should match the playlist file stem
+    stem = extract_stem_from_artifact_path(match_json_path)
+    output_path = artifacts_dir / f"{stem}.enriched.json"
+    
+    # Save enriched match report
+    save_json(match_result, output_path)
+    
+    print()
+    print(f"✓ Found links for {links_found} of {len(tracks_to_enrich)} track(s)")
+    print(f"✓ Saved to: {output_path.resolve()}")
+    print()
+    
+    # Print enriched track list with links
+    enrich_type = "ENRICHED MISSING TRACKS" if missing_only else "ENRICHED TRACKS"
+    print_track_list_with_links(tracks_to_enrich, f"{enrich_type} ({len(tracks_to_enrich)} tracks)")
+    
+    # Print album links summary
+    print_album_links_summary(tracks_to_enrich)
+    
+    # Print tracks where links could not be found
+    if tracks_without_links:
+        print_title(f"TRACKS WITHOUT LINKS ({len(tracks_without_links)} tracks)")
+        for track in tracks_without_links:
+            artist = track.get('artist', 'Unknown Artist')
+            album = track.get('album', '')
+            # Use album if available, otherwise use song title
+            if album:
+                print(f"  {artist} - {album}")
+            else:
+                song = track.get('song', 'Unknown Song')
+                print(f"  {artist} - {song}")
         print()
-        
-        # Print enriched track list with links
-        enrich_type = "ENRICHED MISSING TRACKS" if missing_only else "ENRICHED TRACKS"
-        print_track_list_with_links(tracks_to_enrich, f"{enrich_type} ({len(tracks_to_enrich)} tracks)")
-        
-        # Print album links summary
-        print_album_links_summary(tracks_to_enrich)
-        
-        # Print tracks where links could not be found
-        if tracks_without_links:
-            print_title(f"TRACKS WITHOUT LINKS ({len(tracks_without_links)} tracks)")
-            for track in tracks_without_links:
-                artist = track.get('artist', 'Unknown Artist')
-                album = track.get('album', '')
-                # Use album if available, otherwise use song title
-                if album:
-                    print(f"  {artist} - {album}")
-                else:
-                    song = track.get('song', 'Unknown Song')
-                    print(f"  {artist} - {song}")
-            print()
-        
-        return output_path
-        
-    finally:
-        session.close()
+    
+    return output_path
 
 
 def run_export(input_path: Path, base_folder: str, library_subpath: str, target_dir: Path, overwrite: bool = False) -> Path:
@@ -1307,14 +1608,7 @@ def run_export(input_path: Path, base_folder: str, library_subpath: str, target_
             print(f"⚠ {len(still_missing)} tracks are still missing in library.")
             if prompt_yes_no("Skip missing tracks and export anyway?", default=False):
                 # Filter out missing tracks
-                skipped_artists_songs = {(t['artist'], t['song']) for t in still_missing}
-                original_tracks = playlist_data.get('tracks', [])
-                filtered_tracks = [
-                    t for t in original_tracks
-                    if (t.get('artist', ''), t.get('song', '')) not in skipped_artists_songs
-                ]
-                playlist_data['tracks'] = filtered_tracks
-                playlist_data['meta']['track_count'] = len(filtered_tracks)
+                remove_skipped_tracks(playlist_data, still_missing)
                 print(f"ℹ {len(still_missing)} tracks will be skipped.")
             else:
                 print("Export cancelled.")
@@ -1353,11 +1647,28 @@ def run_export(input_path: Path, base_folder: str, library_subpath: str, target_
         raise
 
 
-def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: Path) -> None:
+def _warm_index_quietly(library_root: Path) -> None:
+    """Background index warm-up; a failure just means Stage 2 builds the index itself."""
+    try:
+        warm_index_cache(library_root, parallel=False)
+    except Exception:
+        pass
+
+
+def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: Path,
+                        url: str = None, target_dir: Path = None, skip_missing: bool = False) -> None:
     """
     Run the full guided pipeline (preserves original behavior).
     
     This runs stages 1-4 end-to-end with user interaction for missing tracks.
+    
+    Args:
+        base_folder: Base folder containing library
+        library_subpath: Subpath to library within base_folder
+        artifacts_dir: Directory to save artifacts
+        url: Playlist URL (prompted for if not provided)
+        target_dir: Directory where playlist folder should be created (settings/prompt if not provided)
+        skip_missing: If True, skip tracks missing from the library without waiting for them to be added
     """
     print_title("GUIDED PIPELINE")
     print("This will run the full workflow with guided interaction.")
@@ -1365,11 +1676,21 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
     
     # Step 1: Get playlist URL
     print_title("STEP 1: PLAYLIST URL")
-    url = prompt_user("Enter playlist URL")
+    if not url:
+        url = prompt_user("Enter playlist URL")
     if not url:
         print("Error: URL is required.")
         sys.exit(1)
     
+    # Library root shared by the re-match passes and directory creation below (resolved once)
+    library_root = resolve_library_root(base_folder, library_subpath)
+    
+    # Index the library in the background while the playlist is fetched and named.
+    # A daemon thread doing a serial build: a scrape error or Ctrl-C exits right away
+    # instead of waiting for the build, and no process pool is forked from a thread.
+    index_warmup = threading.Thread(target=_warm_index_quietly, args=(library_root,), daemon=True)
+    index_warmup.start()
+    
     # Stage 1: Scrape (with optional custom name)
     try:
         playlist_data, playlist_json_path = _scrape_and_prompt_name(url, artifacts_dir, prompt_for_name=True)
@@ -1377,24 +1698,36 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
         print(f"Error scraping playlist: {e}")
         raise
     
-    # Stage 2: Match
+    # Stage 2: Match (reuses the warmed index cache)
+    index_warmup.join()
     match_json_path = run_match(playlist_json_path, base_folder, library_subpath, artifacts_dir)
     match_result = load_json(match_json_path)
     
     # Step 3: Handle missing tracks (interactive)
-    missing_tracks = display_missing_tracks(match_result)
+    missing_tracks, links_by_key = display_missing_tracks(match_result)
     
-    if missing_tracks:
-        print_title("MISSING TRACKS DETECTED")
+    if missing_tracks and skip_missing:
+        # Headless mode: drop missing tracks instead of waiting for them to be added
+        remove_skipped_tracks(playlist_data, missing_tracks)
+        save_json(playlist_data, playlist_json_path)
         
-        # Calculate library root path
-        library_root_path = Path(base_folder)
-        if library_subpath:
-            library_root_path = library_root_path / library_subpath
-        library_root_path = library_root_path.resolve()
+        match_result = match_playlist_to_library(
+            data=playlist_data,
+            base_folder=library_root,
+            library_subpath="",
+            include_candidates=True,
+            max_candidates=5,
+        )
+        match_result["playlist_data"] = playlist_data
+        save_json(match_result, match_json_path)
+        
+        print(f"ℹ {len(missing_tracks)} tracks will be skipped in playlist creation.")
+        print()
+    elif missing_tracks:
+        print_title("MISSING TRACKS DETECTED")
         
         # Offer to create artist directories
-        create_artist_directories(missing_tracks, library_root_path)
+        create_artist_directories(missing_tracks, library_root)
         
         print("Please add the missing tracks to your library, then confirm when ready.")
         print()
@@ -1408,8 +1741,8 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
         print("Re-matching tracks...")
         match_result = match_playlist_to_library(
             data=playlist_data,
-            base_folder=base_folder,
-            library_subpath=library_subpath,
+            base_folder=library_root,
+            library_subpath="",
             include_candidates=True,
             max_candidates=5,
         )
@@ -1421,29 +1754,15 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
         still_missing = [r for r in match_result["results"] if r["match_status"] == "missing"]
         if still_missing:
             # Ask user to confirm skipping each track
-            confirmed_skips = confirm_skip_tracks(still_missing)
+            confirmed_skips = confirm_skip_tracks(still_missing, links_by_key)
             
             if confirmed_skips is None:
                 # User chose not to skip some tracks
                 print("Exiting.")
                 sys.exit(0)
             
-            if len(confirmed_skips) < len(still_missing):
-                # Some tracks were not confirmed to skip - this shouldn't happen but handle it
-                print("Warning: Not all tracks were confirmed to skip.")
-                if not prompt_yes_no("Continue with confirmed skips only?", default=False):
-                    print("Exiting.")
-                    sys.exit(0)
-            
             # Remove skipped tracks from playlist_data for playlist creation
-            skipped_artists_songs = {(t['artist'], t['song']) for t in confirmed_skips}
-            original_tracks = playlist_data.get('tracks', [])
-            filtered_tracks = [
-                t for t in original_tracks
-                if (t.get('artist', ''), t.get('song', '')) not in skipped_artists_songs
-            ]
-            playlist_data['tracks'] = filtered_tracks
-            playlist_data['meta']['track_count'] = len(filtered_tracks)
+            remove_skipped_tracks(playlist_data, confirmed_skips)
             
             # Update saved playlist JSON
             save_json(playlist_data, playlist_json_path)
@@ -1451,8 +1770,8 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
             # Re-run match to update match report
             match_result = match_playlist_to_library(
                 data=playlist_data,
-                base_folder=base_folder,
-                library_subpath=library_subpath,
+                base_folder=library_root,
+                library_subpath="",
                 include_candidates=True,
                 max_candidates=5,
             )
@@ -1467,7 +1786,12 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
     
     # Check if target directory is valid
     target_path = None
-    if default_target:
+    if target_dir:
+        target_path = Path(target_dir).expanduser()
+        if not target_path.exists():
+            print(f"Error: Target directory does not exist: {target_path}")
+            sys.exit(1)
+    elif default_target:
         target_path = Path(default_target).expanduser()
         if not target_path.exists():
             target_path = None
@@ -1475,7 +1799,7 @@ def run_guided_pipeline(base_folder: str, library_subpath: str, artifacts_dir: P
     if target_path:
         # Valid setting exists, use it silently
         print_title("STEP 4: CREATE PLAYLIST")
-        print(f"Using saved target directory: {target_path}")
+        print(f"Using target directory: {target_path}")
         print()
     else:
         # Settings invalid or missing, prompt user
@@ -1596,14 +1920,17 @@ def list_artifacts(artifact_type: str = None) -> list[Path]:
     if not ARTIFACTS_DIR.exists():
         return []
     
-    artifacts = []
-    pattern = f"*.{artifact_type}.json" if artifact_type else "*.json"
+    suffix = f".{artifact_type}.json" if artifact_type else ".json"
     
-    for path in sorted(ARTIFACTS_DIR.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True):
-        if path.is_file():
-            artifacts.append(path)
+    # One scandir pass: is_file() uses the cached entry type, so each artifact is stat'ed once
+    entries = []
+    with os.scandir(ARTIFACTS_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(suffix) and entry.is_file():
+                entries.append((entry.stat().st_mtime, Path(entry.path)))
     
-    return artifacts
+    entries.sort(key=operator.itemgetter(0), reverse=True)
+    return [path for _mtime, path in entries]
 
 
 def group_artifacts_by_stem() -> dict[str, list[Path]]:
@@ -2274,14 +2601,60 @@ def run_main_menu_loop() -> None:
             return
 
 
-def main():
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    With no arguments Spindle runs the interactive menu. Passing --url runs the
+    full pipeline directly, which together with --yes can be scripted (cron, CI).
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(description="Spindle - curated radio → local playlists")
+    parser.add_argument("--url", help="Playlist URL; runs the full pipeline instead of the menu")
+    parser.add_argument("--library", help="Library root folder (overrides saved settings)")
+    parser.add_argument("--target", help="Target directory for the playlist folder (overrides saved settings)")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="Non-interactive: accept the default answer for every prompt")
+    parser.add_argument("--skip-missing", action="store_true",
+                        help="Skip tracks missing from the library instead of waiting for them to be added")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None):
     """Main entry point."""
+    global ASSUME_YES
+    
+    args = parse_args(argv)
+    if args.yes and not args.url:
+        # The menu needs choices that --yes cannot supply
+        print("Error: --yes requires --url.")
+        sys.exit(2)
+    ASSUME_YES = args.yes
+    
     print_banner()
     
     # Ensure artifacts directory exists
-    ARTIFACTS_DIR.mkdir(exist_ok=True)
+    ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    if not args.url:
+        run_main_menu_loop()
+        return
+    
+    url = validate_url(args.url)
+    if args.library:
+        base_folder = str(validate_file_path(Path(args.library), "library folder"))
+        library_subpath = ""
+    else:
+        base_folder, library_subpath = get_library_path()
     
-    run_main_menu_loop()
+    target_dir = Path(args.target) if args.target else None
+    run_guided_pipeline(base_folder, library_subpath, ARTIFACTS_DIR,
+                        url=url, target_dir=target_dir, skip_missing=args.skip_missing)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,70 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
 import re
+import string
+import tempfile
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-
-AUDIO_EXTS = {".mp3", ".m4a", ".flac", ".wav", ".aiff", ".aif", ".ogg", ".opus", ".alac"}
-
-
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+AUDIO_EXTS = frozenset({".mp3", ".m4a", ".flac", ".wav", ".aiff", ".aif", ".ogg", ".opus", ".alac"})
+
+# Minimum rapidfuzz token_set_ratio (0-100) for a file to be suggested as a candidate
+CANDIDATE_SCORE_CUTOFF = 50
+
+# Folders that never hold library tracks (NAS thumbnails, archive debris, recycle bins, VCS and
+# macOS volume metadata). Other dot-folders are walked: ".38 Special" is a real artist.
+SKIP_DIR_NAMES = frozenset({
+    "__MACOSX", "@eaDir", "#recycle", "$RECYCLE.BIN", "System Volume Information",
+    ".git", ".Trashes", ".Spotlight-V100", ".fseventsd", ".AppleDouble", ".TemporaryItems",
+})
+
+# Libraries with at least this many audio files are indexed across worker processes
+INDEX_PARALLEL_MIN_FILES = 5000
+INDEX_WORKERS = os.cpu_count() or 1
+# Threads used to walk artist folders concurrently (the walk is I/O-bound)
+WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# The built index is saved as plain JSON in a per-user cache folder (one file per library root)
+# and reused until the folder layout changes
+INDEX_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "spindle"
+INDEX_CACHE_VERSION = 4  # bump whenever the index key scheme or file format changes
+
+# Precompiled patterns (these run several times per indexed file and per playlist track)
+_RE_FEAT_PAREN = re.compile(r"\s*\(feat\.?.*?\)")
+_RE_FEAT_BRACKET = re.compile(r"\s*\[feat\.?.*?\]")
+_RE_FEAT_TRAIL = re.compile(r"\s*feat\.?\s+.*$")
+_RE_PUNCT = re.compile(r"[^a-z0-9\s]")
+# Same filter as _RE_PUNCT for ASCII input, applied by str/bytes.translate in C
+_ASCII_PUNCT_CHARS = "".join(
+    c for c in map(chr, range(128))
+    if c not in string.ascii_lowercase and c not in string.digits and not c.isspace()
+)
+_ASCII_PUNCT_TABLE = str.maketrans("", "", _ASCII_PUNCT_CHARS)
+_ASCII_PUNCT_BYTES = _ASCII_PUNCT_CHARS.encode("ascii")
+# str.split() treats \x1c-\x1f as whitespace but bytes.split() does not, so map them to spaces
+_ASCII_WS_BYTES = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+_RE_SEP = re.compile(r'\s*-\s*|\s*–\s*|\s*—\s*')
+_RE_ALBUM_SUFFIX = re.compile(r'\s*-\s*(single|ep|album|lp)\s*$', flags=re.IGNORECASE)
+_RE_YEAR = re.compile(r'\s*[\[\(]\d{4}[\]\)]\s*$')
+
+
+@lru_cache(maxsize=65536)
 def _norm(s: str) -> str:
     """
     Normalize strings to improve match rate across:
@@ -21,35 +77,171 @@ def _norm(s: str) -> str:
     if s is None:
         return ""
 
-    # Normalize unicode (e.g., “I’ll” → "I'll" in many cases)
-    s = unicodedata.normalize("NFKD", s)
+    # Normalize unicode (e.g., “I’ll” → "I'll" in many cases); ASCII is already NFKD
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
 
     s = s.lower()
 
     # Remove common featuring patterns from titles/artists
-    s = re.sub(r"\s*\(feat\.?.*?\)", "", s)
-    s = re.sub(r"\s*\[feat\.?.*?\]", "", s)
-    s = re.sub(r"\s*feat\.?\s+.*$", "", s)
+    if "feat" in s:  # all three patterns need it; most names never get here
+        s = _RE_FEAT_PAREN.sub("", s)
+        s = _RE_FEAT_BRACKET.sub("", s)
+        s = _RE_FEAT_TRAIL.sub("", s)
 
     # Replace & with and (common difference in file naming)
     s = s.replace("&", "and")
 
-    # Drop punctuation (keep letters/numbers/spaces)
-    s = re.sub(r"[^a-z0-9\s]", "", s)
-
-    # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    # Drop punctuation (keep letters/numbers/spaces) and collapse whitespace
+    if s.isascii():
+        # Flat 256-byte tables and bytes.split(), no regex or per-codepoint dispatch
+        b = s.encode("ascii").translate(_ASCII_WS_BYTES, _ASCII_PUNCT_BYTES)
+        s = b" ".join(b.split()).decode("ascii")
+    else:
+        s = _RE_PUNCT.sub("", s.translate(_ASCII_PUNCT_TABLE))
+        s = " ".join(s.split())
 
     return s
 
 
+# Common variations of "Various Artists" folder names (normalized once, in priority order)
+_VARIOUS_ARTISTS_NAMES = tuple(_norm(name) for name in (
+    "various artists",
+    "various",
+    "va",
+    "compilation",
+    "compilations",
+    "soundtrack",
+    "soundtracks",
+    "ost",
+))
+
+
+def is_skipped(name: str, is_dir: bool) -> bool:
+    """True for system folders and hidden files (.DS_Store, AppleDouble "._Song.mp3") the walk ignores."""
+    return name in SKIP_DIR_NAMES if is_dir else name.startswith(".")
+
+
+def has_audio_ext(name: str) -> bool:
+    """Extension check on a bare file name (cheaper than os.path.splitext; hidden files are skipped first)."""
+    return name[name.rfind("."):].lower() in AUDIO_EXTS
+
+
 def _iter_audio_files(library_root: Path):
-    """Yield all audio files under library_root."""
-    for p in library_root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in AUDIO_EXTS:
-            yield p
+    """Yield all audio files under library_root (same order as rglob, without a Path/stat per entry)."""
+    stack = [str(library_root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_skipped(entry.name, is_dir):
+                continue
+            if is_dir:
+                subdirs.append(entry.path)
+            elif has_audio_ext(entry.name) and entry.is_file():
+                yield Path(entry.path)
+        # Pre-order walk: the first subdirectory is searched next, like rglob
+        stack.extend(reversed(subdirs))
+
+
+def _list_audio_files(library_root: Path, max_workers: Optional[int] = None) -> List[Path]:
+    """
+    List all audio files under library_root, walking each top-level folder on its own thread.
 
+    scandir releases the GIL, so on network volumes and cold caches the per-artist walks
+    overlap their I/O. The result is in the same order as _iter_audio_files.
+    max_workers caps the thread count (default WALK_WORKERS); 1 walks serially.
+    """
+    workers = WALK_WORKERS if max_workers is None else max(1, max_workers)
+    try:
+        with os.scandir(library_root) as it:
+            entries = list(it)
+    except OSError:
+        return []
+
+    files: List[Path] = []
+    subdirs = []
+    for entry in entries:
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if is_skipped(entry.name, is_dir):
+            continue
+        if is_dir:
+            subdirs.append(Path(entry.path))
+        elif has_audio_ext(entry.name) and entry.is_file():
+            files.append(Path(entry.path))
+
+    if workers > 1 and len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as executor:
+            for subtree in executor.map(lambda d: list(_iter_audio_files(d)), subdirs):
+                files.extend(subtree)
+    else:
+        for d in subdirs:
+            files.extend(_iter_audio_files(d))
+    return files
+
+
+def _needs_extraction(stem: str, norm_stem: str, norm_artist: str) -> bool:
+    """
+    Cheap pre-check: False means _extract_track_name_from_filename(stem, ...) == norm_stem.
 
+    Extraction can only change a name with a leading track number, a dash separator,
+    or a normalized form that starts with the artist name.
+    """
+    return (
+        stem[:1].isdecimal()
+        or '-' in stem or '–' in stem or '—' in stem
+        or norm_stem.startswith(norm_artist)
+    )
+
+
+def _strip_track_number(stem: str) -> str:
+    """Drop a leading track number like "01. " or "1 " from a filename stem."""
+    n = len(stem)
+    i = 0
+    while i < n and stem[i].isdecimal():
+        i += 1
+    if i == 0:
+        return stem
+    if i < n and stem[i] == '.':
+        i += 1
+    j = i
+    while j < n and stem[j].isspace():
+        j += 1
+    return stem[j:] if j > i else stem
+
+
+def _strip_enclosed(s: str, open_ch: str, close_ch: str) -> str:
+    """Replace each "(...)" group and its surrounding whitespace with one space."""
+    start = s.find(open_ch)
+    if start < 0:
+        return s
+    pieces = []
+    pos = 0
+    while start >= 0:
+        end = s.find(close_ch, start + 1)
+        if end < 0:
+            break
+        pieces.append(s[pos:start].rstrip())
+        pieces.append(' ')
+        pos = end + 1
+        while pos < len(s) and s[pos].isspace():
+            pos += 1
+        start = s.find(open_ch, pos)
+    pieces.append(s[pos:])
+    return ''.join(pieces)
+
+
+def _strip_parentheticals(s: str) -> str:
+    """Remove "(...)" and "[...]" groups, e.g. "Dancing (2020 Version)" -> "Dancing"."""
+    return _strip_enclosed(_strip_enclosed(s, '(', ')'), '[', ']').strip()
+
+
+@lru_cache(maxsize=65536)
 def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     """
     Try to extract just the track name from a filename that might include artist name or track numbers.
@@ -70,7 +262,7 @@ def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     
     # Remove track numbers at the start FIRST (e.g., "01. Track Name" -> "Track Name")
     # Handle both "01. " and "1. " formats
-    cleaned_stem = re.sub(r'^\d+\.?\s+', '', filename_stem)
+    cleaned_stem = _strip_track_number(filename_stem)
     
     # Now normalize the cleaned stem
     norm_stem = _norm(cleaned_stem)
@@ -78,14 +270,13 @@ def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     # If filename starts with artist name, try to remove it
     if norm_stem.startswith(norm_artist):
         # Try "Artist - Track" or "Artist-Track" pattern
+        # (_norm already dropped the dash, so only the space needs stripping)
         remaining = norm_stem[len(norm_artist):].strip()
-        # Remove leading dash/hyphen/separator
-        remaining = re.sub(r'^[-\s]+', '', remaining)
         if remaining:
             return remaining
     
     # Also try splitting on common separators (on the original cleaned stem before normalization)
-    parts = re.split(r'\s*-\s*|\s*–\s*|\s*—\s*', cleaned_stem)
+    parts = _RE_SEP.split(cleaned_stem)
     if len(parts) > 1:
         # Normalize first part and check if it matches artist
         if _norm(parts[0]) == norm_artist and len(parts) > 1:
@@ -97,6 +288,7 @@ def _extract_track_name_from_filename(filename_stem: str, artist: str) -> str:
     return norm_stem
 
 
+@lru_cache(maxsize=65536)
 def _normalize_album_name(album: str) -> str:
     """
     Normalize album name by removing common suffixes/patterns that vary.
@@ -114,18 +306,108 @@ def _normalize_album_name(album: str) -> str:
     
     # Remove common suffixes BEFORE normalization (to preserve punctuation)
     # Remove "- Single", "- EP", etc.
-    album = re.sub(r'\s*-\s*(single|ep|album|lp)\s*$', '', album, flags=re.IGNORECASE)
+    album = _RE_ALBUM_SUFFIX.sub('', album)
     
     # Remove year patterns like "(2023)" or "[2023]"
-    album = re.sub(r'\s*[\[\(]\d{4}[\]\)]\s*$', '', album)
+    album = _RE_YEAR.sub('', album)
     
     # Now normalize
     return _norm(album).strip()
 
 
-def _build_index(library_root: Path) -> Dict[Tuple[str, str, str], List[Path]]:
+@lru_cache(maxsize=4096)
+def _track_keys(artist: str, album: str, title: str) -> Tuple[str, str, str, str]:
+    """
+    Normalized (artist, album, flexible album, title) keys for a playlist track.
+
+    Cached so the re-match passes after skipping/adding tracks don't re-normalize
+    the same playlist entries.
     """
-    Build an index: (norm_artist, norm_album, norm_track_stem) -> [paths...]
+    return _norm(artist), _norm(album), _normalize_album_name(album), _norm(title)
+
+
+def _index_file_keys(f: Path) -> List[Tuple[str, str, str]]:
+    """Return every index key for one audio file, in the order _build_index adds them."""
+    keys: List[Tuple[str, str, str]] = []
+    # Expect .../Artist/Album/Track.ext
+    try:
+        album_dir = f.parent
+        artist_dir = album_dir.parent
+        artist = artist_dir.name
+        album = album_dir.name
+        track_stem = f.stem  # filename without extension
+    except Exception:
+        return keys
+
+    norm_artist = _norm(artist)
+    norm_album = _norm(album)
+    norm_track = _norm(track_stem)
+    norm_album_flexible = _normalize_album_name(album)
+
+    # Primary key: exact match
+    key = (norm_artist, norm_album, norm_track)
+    keys.append(key)
+
+    # Alternative key 1: extracted track name (handles "Artist - Song" and "02. Song" formats)
+    extracted_track = (_extract_track_name_from_filename(track_stem, artist)
+                       if _needs_extraction(track_stem, norm_track, norm_artist) else norm_track)
+    if extracted_track != norm_track:
+        alt_key1 = (norm_artist, norm_album, extracted_track)
+        keys.append(alt_key1)
+
+        # Also with normalized album name
+        if norm_album_flexible != norm_album:
+            alt_key1b = (norm_artist, norm_album_flexible, extracted_track)
+            keys.append(alt_key1b)
+
+    # Alternative key 2: normalized album name (handles "Album - EP" vs "Album")
+    if norm_album_flexible != norm_album:
+        alt_key2 = (norm_artist, norm_album_flexible, norm_track)
+        keys.append(alt_key2)
+
+        # Combined: normalized album + extracted track
+        if extracted_track != norm_track:
+            alt_key2b = (norm_artist, norm_album_flexible, extracted_track)
+            keys.append(alt_key2b)
+
+    # Alternative key 3: track name without parenthetical content
+    # Handles "Dancing (2020 Version)" vs "Dancing"
+    track_no_parens = _strip_parentheticals(track_stem)
+    if track_no_parens and track_no_parens != track_stem:
+        norm_track_no_parens = _norm(track_no_parens)
+        if norm_track_no_parens != norm_track:
+            # With original album
+            alt_key3 = (norm_artist, norm_album, norm_track_no_parens)
+            keys.append(alt_key3)
+            # With normalized album
+            if norm_album_flexible != norm_album:
+                alt_key3b = (norm_artist, norm_album_flexible, norm_track_no_parens)
+                keys.append(alt_key3b)
+            # Also extract track name from the cleaned version
+            extracted_no_parens = (
+                _extract_track_name_from_filename(track_no_parens, artist)
+                if _needs_extraction(track_no_parens, norm_track_no_parens, norm_artist)
+                else norm_track_no_parens
+            )
+            if extracted_no_parens != norm_track_no_parens:
+                alt_key3c = (norm_artist, norm_album, extracted_no_parens)
+                keys.append(alt_key3c)
+                if norm_album_flexible != norm_album:
+                    alt_key3d = (norm_artist, norm_album_flexible, extracted_no_parens)
+                    keys.append(alt_key3d)
+
+    # Branches overlap (e.g. alt_key1b == alt_key2b), so list the file once per distinct key
+    return list(dict.fromkeys(keys))
+
+
+def _index_shard(files: List[Path]) -> List[Tuple[Path, List[Tuple[str, str, str]]]]:
+    """Compute index keys for a slice of the library (runs in a worker process)."""
+    return [(f, _index_file_keys(f)) for f in files]
+
+
+def _build_index(library_root: Path, parallel: bool = True) -> Dict[Tuple[str, str, str], Tuple[Path, ...]]:
+    """
+    Build an index: (norm_artist, norm_album, norm_track_stem) -> (paths...)
 
     Assumes folder structure:
         Library/Artist/Album/Track.ext
@@ -133,83 +415,124 @@ def _build_index(library_root: Path) -> Dict[Tuple[str, str, str], List[Path]]:
     Also indexes alternative keys for flexible matching:
     - (norm_artist, norm_album, extracted_track_name) where track name is extracted from filename
     - (norm_artist, normalized_album, ...) with normalized album names
+
+    parallel=False walks and indexes on the calling thread only (no thread or process pools).
     """
     index: Dict[Tuple[str, str, str], List[Path]] = {}
 
-    for f in _iter_audio_files(library_root):
-        # Expect .../Artist/Album/Track.ext
+    files = _list_audio_files(library_root, max_workers=None if parallel else 1)
+    workers = INDEX_WORKERS if parallel else 1
+
+    shard_results = None
+    if workers > 1 and len(files) >= INDEX_PARALLEL_MIN_FILES:
+        # Normalization is pure-Python and CPU-bound, so shard across processes;
+        # executor.map keeps shard order, so each key's paths keep library order
+        shard_size = -(-len(files) // workers)
+        shards = [files[i:i + shard_size] for i in range(0, len(files), shard_size)]
         try:
-            album_dir = f.parent
-            artist_dir = album_dir.parent
-            artist = artist_dir.name
-            album = album_dir.name
-            track_stem = f.stem  # filename without extension
-        except Exception:
-            continue
+            # spawn, not fork: the caller may have other threads running (HTTP, prompts)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                shard_results = list(executor.map(_index_shard, shards))
+        except (OSError, BrokenProcessPool):
+            shard_results = None
+    if shard_results is None:
+        shard_results = [_index_shard(files)]
+
+    for shard in shard_results:
+        for f, keys in shard:
+            for key in keys:
+                index.setdefault(key, []).append(f)
+
+    # Most keys hold a single file; a tuple is smaller than a list and the index is never mutated
+    return {key: tuple(paths) for key, paths in index.items()}
 
-        norm_artist = _norm(artist)
-        norm_album = _norm(album)
-        norm_track = _norm(track_stem)
-        norm_album_flexible = _normalize_album_name(album)
-        
-        # Primary key: exact match
-        key = (norm_artist, norm_album, norm_track)
-        index.setdefault(key, []).append(f)
-        
-        # Alternative key 1: extracted track name (handles "Artist - Song" and "02. Song" formats)
-        extracted_track = _extract_track_name_from_filename(track_stem, artist)
-        if extracted_track != norm_track:
-            alt_key1 = (norm_artist, norm_album, extracted_track)
-            index.setdefault(alt_key1, []).append(f)
-            
-            # Also with normalized album name
-            if norm_album_flexible != norm_album:
-                alt_key1b = (norm_artist, norm_album_flexible, extracted_track)
-                index.setdefault(alt_key1b, []).append(f)
-        
-        # Alternative key 2: normalized album name (handles "Album - EP" vs "Album")
-        if norm_album_flexible != norm_album:
-            alt_key2 = (norm_artist, norm_album_flexible, norm_track)
-            index.setdefault(alt_key2, []).append(f)
-            
-            # Combined: normalized album + extracted track
-            if extracted_track != norm_track:
-                alt_key2b = (norm_artist, norm_album_flexible, extracted_track)
-                index.setdefault(alt_key2b, []).append(f)
-        
-        # Alternative key 3: track name without parenthetical content
-        # Handles "Dancing (2020 Version)" vs "Dancing"
-        track_no_parens = re.sub(r'\s*\([^)]*\)\s*', ' ', track_stem)
-        track_no_parens = re.sub(r'\s*\[[^\]]*\]\s*', ' ', track_no_parens)
-        track_no_parens = track_no_parens.strip()
-        if track_no_parens and track_no_parens != track_stem:
-            norm_track_no_parens = _norm(track_no_parens)
-            if norm_track_no_parens != norm_track:
-                # With original album
-                alt_key3 = (norm_artist, norm_album, norm_track_no_parens)
-                index.setdefault(alt_key3, []).append(f)
-                # With normalized album
-                if norm_album_flexible != norm_album:
-                    alt_key3b = (norm_artist, norm_album_flexible, norm_track_no_parens)
-                    index.setdefault(alt_key3b, []).append(f)
-                # Also extract track name from the cleaned version
-                extracted_no_parens = _extract_track_name_from_filename(track_no_parens, artist)
-                if extracted_no_parens != norm_track_no_parens:
-                    alt_key3c = (norm_artist, norm_album, extracted_no_parens)
-                    index.setdefault(alt_key3c, []).append(f)
-                    if norm_album_flexible != norm_album:
-                        alt_key3d = (norm_artist, norm_album_flexible, extracted_no_parens)
-                        index.setdefault(alt_key3d, []).append(f)
+
+def _library_fingerprint(library_root: Path) -> List[List]:
+    """
+    Cheap signature of the library layout (no per-file stat calls).
+
+    A directory's mtime moves whenever an entry inside it is added, removed or renamed,
+    which is all the index depends on. Returned as plain lists so it compares equal
+    to the copy read back from the JSON cache.
+    """
+    root = str(library_root)
+    parts = []
+    for dirpath, dirnames, _filenames in os.walk(root):
+        # Prune exactly what _iter_audio_files skips
+        dirnames[:] = sorted(d for d in dirnames if not is_skipped(d, True))
+        parts.append([os.path.relpath(dirpath, root), os.stat(dirpath).st_mtime_ns])
+    return parts
+
+
+def _index_cache_path(library_root: Path) -> Path:
+    """Per-user cache file for library_root (keyed by the resolved root path)."""
+    digest = hashlib.sha1(str(library_root).encode("utf-8")).hexdigest()[:16]
+    return INDEX_CACHE_DIR / f"index-{digest}.json"
+
+
+def _load_or_build_index(library_root: Path, parallel: bool = True) -> Dict[Tuple[str, str, str], Tuple[Path, ...]]:
+    """Return the cached index for library_root if its layout is unchanged, else rebuild and cache it."""
+    cache_path = _index_cache_path(library_root)
+    fingerprint = _library_fingerprint(library_root)
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if (cached.get("version") == INDEX_CACHE_VERSION
+                and cached.get("root") == str(library_root)
+                and cached.get("fingerprint") == fingerprint):
+            # Plain strings only; entries are [artist, album, title, [path, ...]]
+            return {
+                (artist, album, title): tuple(Path(p) for p in paths)
+                for artist, album, title, paths in cached["index"]
+            }
+    except Exception:
+        pass  # missing, unreadable or stale cache - rebuild
+
+    index = _build_index(library_root, parallel=parallel)
+
+    payload = {
+        "version": INDEX_CACHE_VERSION,
+        "root": str(library_root),
+        "fingerprint": fingerprint,
+        "index": [[*key, [str(p) for p in paths]] for key, paths in index.items()],
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name, so concurrent runs never write into each other's file
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.stem + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass  # unwritable cache folder: just skip caching
 
     return index
 
 
+def warm_index_cache(library_root: str | Path, parallel: bool = True) -> None:
+    """
+    Build (or validate) the on-disk index cache ahead of a match.
+
+    The next match_playlist_to_library call on this library then loads the cache.
+    From a background thread pass parallel=False: the build then starts no pools,
+    so the thread can be a daemon that the interpreter abandons on exit.
+    """
+    _load_or_build_index(Path(library_root).expanduser().resolve(), parallel=parallel)
+
+
 def match_playlist_to_library(
     data: Dict[str, Any],
     base_folder: str | Path,
     library_subpath: str = "Music/Library",
     include_candidates: bool = True,
     max_candidates: int = 5,
+    use_index_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Match scraped playlist data against a local music library.
@@ -228,6 +551,11 @@ def match_playlist_to_library(
         If True, include "near misses" (same artist+album, track name similar-ish).
     max_candidates : int
         Cap the number of candidate paths returned per missing track.
+    use_index_cache : bool
+        If True, reuse (and refresh) the index cached as JSON in INDEX_CACHE_DIR
+        ($XDG_CACHE_HOME/spindle, default ~/.cache/spindle) as index-<hash of library_root>.json
+        instead of re-normalizing the whole library on every run. The cache is rebuilt
+        whenever any library folder's mtime changes (a file or folder added, removed or renamed).
 
     Returns
     -------
@@ -242,187 +570,174 @@ def match_playlist_to_library(
     if not library_root.exists():
         raise FileNotFoundError(f"Library root not found: {library_root}")
 
-    # 1) Index your library ONCE (fast lookups afterwards)
-    index = _build_index(library_root)
+    # 1) Index your library lazily, ONCE (on the first track with something to match)
+    index: Dict[Tuple[str, str, str], Tuple[Path, ...]] | None = None
 
     results: List[Dict[str, Any]] = []
     found_count = 0
 
     # Optional: precompute a lightweight artist+album grouping for candidate search
     artist_album_to_paths: Dict[Tuple[str, str], List[Path]] = {}
-    if include_candidates:
-        for (a, al, _t), paths in index.items():
-            artist_album_to_paths.setdefault((a, al), []).extend(paths)
+    # (artist, track) -> paths across all albums, so the album-agnostic exact lookup is O(1)
+    artist_title_to_paths: Dict[Tuple[str, str], List[Path]] = {}
+    # artist -> [(album, track, track tokens, paths), ...] so fuzzy strategies scan one artist,
+    # not the whole index, and never re-split track names
+    artist_entries: Dict[str, List[Tuple[str, str, frozenset, Tuple[Path, ...]]]] = {}
+    # Candidate file -> normalized stem tokens, shared by every missing track from the same album
+    stem_tokens: Dict[Path, frozenset] = {}
 
     for track in data.get("tracks", []):
         artist = track.get("artist") or ""
         album = track.get("release") or ""
         title = track.get("song") or ""
 
+        if not artist and not title:
+            # Blank/separator rows: nothing to match on, and no reason to walk the library
+            item = {
+                "time": track.get("time"),
+                "artist": artist,
+                "album": album,
+                "song": title,
+                "match_status": "missing",
+                "matched_paths": [],
+            }
+            if include_candidates:
+                item["candidate_paths"] = []
+            results.append(item)
+            continue
+
+        matches: List[Path] = []
+
+        if index is None:
+            index = _load_or_build_index(library_root) if use_index_cache else _build_index(library_root)
+            for (a, al, t), paths in index.items():
+                artist_entries.setdefault(a, []).append((al, t, frozenset(t.split()), paths))
+                artist_title_to_paths.setdefault((a, t), []).extend(paths)
+                if include_candidates:
+                    artist_album_to_paths.setdefault((a, al), []).extend(paths)
+
         # Try multiple matching strategies
-        matches = []
-        norm_artist = _norm(artist)
-        norm_album = _norm(album)
-        norm_album_flexible = _normalize_album_name(album)
-        norm_title = _norm(title)
-        
-        # Strategy 1: Exact match (artist, album, track)
-        key = (norm_artist, norm_album, norm_title)
-        matches.extend(index.get(key, []))
-        
-        # Strategy 2: With normalized album name
-        if not matches and norm_album_flexible != norm_album:
-            key2 = (norm_artist, norm_album_flexible, norm_title)
-            matches.extend(index.get(key2, []))
+        norm_artist, norm_album, norm_album_flexible, norm_title = _track_keys(artist, album, title)
+        title_tokens = frozenset(norm_title.split())
+        # Playlist title with any "Artist - " / track-number prefix removed (Strategies 3 and 7)
+        extracted_playlist_title = _extract_track_name_from_filename(title, artist)
         
-        # Strategy 3: Try matching with extracted track name from files
-        # (handles "Artist - Song.flac" and "02. Song.flac" formats)
-        # The index already has alternative keys with extracted track names, so we need to
-        # simulate what the extraction would do for the playlist title
-        if not matches:
-            # Try with normalized album variations
-            for alt_album in [norm_album, norm_album_flexible]:
-                if alt_album:
-                    # Direct lookup (index should have this from extracted track names)
-                    key3 = (norm_artist, alt_album, norm_title)
-                    matches.extend(index.get(key3, []))
-                    
-                    # Also try if the title itself needs extraction (e.g., "Artist - Title" format)
-                    # This handles cases where playlist has "Artist - Title" but file is "01. Title"
-                    extracted_playlist_title = _extract_track_name_from_filename(title, artist)
-                    if extracted_playlist_title != norm_title:
-                        key3b = (norm_artist, alt_album, extracted_playlist_title)
-                        matches.extend(index.get(key3b, []))
+        # Strategies 1-3: exact key lookups, one stage at a time (first stage with a hit wins)
+        #   1) (artist, album, track)
+        #   2) with normalized album name (handles "Album - EP" vs "Album")
+        #   3) with the track name extracted from the playlist title, for either album form
+        #      (playlist has "Artist - Title" but file is "01. Title"; the index already
+        #      holds extracted-name keys for "Artist - Song.flac" / "02. Song.flac" files)
+        key_stages = (
+            ((norm_artist, norm_album, norm_title),),
+            ((norm_artist, norm_album_flexible, norm_title),) if norm_album_flexible != norm_album else (),
+            tuple((norm_artist, alt_album, extracted_playlist_title)
+                  for alt_album in (norm_album, norm_album_flexible) if alt_album)
+            if extracted_playlist_title != norm_title else (),
+        )
+        for keys in key_stages:
+            for key in keys:
+                matches.extend(index.get(key, ()))
+            if matches:
+                break
         
         # Strategy 4: Token-based fuzzy matching within same artist/album
         # (fallback for edge cases)
         if not matches:
-            title_tokens = set(norm_title.split())
             if title_tokens:
-                for (a, al, t), paths in index.items():
-                    if a == norm_artist:
-                        # Try both exact album and normalized album match
-                        album_matches = (al == norm_album or 
-                                       (norm_album_flexible and al == norm_album_flexible))
-                        if album_matches:
-                            # Check if track name tokens are contained in filename
-                            track_tokens = set(t.split())
-                            # If all title tokens are in track name, it's a match
-                            if title_tokens.issubset(track_tokens):
-                                matches.extend(paths)
-                            # Also try reverse: if track tokens are subset of title (handles parenthetical content)
-                            elif track_tokens.issubset(title_tokens) and len(track_tokens) >= 2:
+                for al, t, track_tokens, paths in artist_entries.get(norm_artist, ()):
+                    # Try both exact album and normalized album match
+                    album_matches = (al == norm_album or 
+                                   (norm_album_flexible and al == norm_album_flexible))
+                    if album_matches:
+                        # Check if track name tokens are contained in filename
+                        # If all title tokens are in track name, it's a match
+                        if title_tokens.issubset(track_tokens):
+                            matches.extend(paths)
+                        # Also try reverse: if track tokens are subset of title (handles parenthetical content)
+                        elif track_tokens.issubset(title_tokens) and len(track_tokens) >= 2:
+                            matches.extend(paths)
+                        # Or if there's significant overlap (at least 2/3 of shorter set)
+                        elif title_tokens and track_tokens:
+                            overlap = len(title_tokens & track_tokens)
+                            min_len = min(len(title_tokens), len(track_tokens))
+                            if min_len >= 2 and overlap >= (min_len * 2 // 3):
                                 matches.extend(paths)
-                            # Or if there's significant overlap (at least 2/3 of shorter set)
-                            elif title_tokens and track_tokens:
-                                overlap = len(title_tokens & track_tokens)
-                                min_len = min(len(title_tokens), len(track_tokens))
-                                if min_len >= 2 and overlap >= (min_len * 2 // 3):
-                                    matches.extend(paths)
         
         # Strategy 5: Try matching title without parenthetical content
         # Handles cases like "Dancing (2020 Version)" vs "Dancing"
         if not matches:
             # Remove parenthetical content from title (e.g., "(2020 Version)", "[Remix]", etc.)
-            title_no_parens = re.sub(r'\s*\([^)]*\)\s*', ' ', title)
-            title_no_parens = re.sub(r'\s*\[[^\]]*\]\s*', ' ', title_no_parens)
-            title_no_parens = title_no_parens.strip()
+            title_no_parens = _strip_parentheticals(title)
             if title_no_parens and title_no_parens != title:
                 norm_title_no_parens = _norm(title_no_parens)
                 for alt_album in [norm_album, norm_album_flexible]:
                     if alt_album:
                         key5 = (norm_artist, alt_album, norm_title_no_parens)
-                        matches.extend(index.get(key5, []))
+                        matches.extend(index.get(key5, ()))
         
         # Strategy 6: Fallback - match by artist + track only (ignore album)
         # This handles cases where album names are completely different
         # (e.g., playlist says "BIG - Single" but file is in "Gun" album)
         if not matches:
             # Try exact track match with any album for this artist
-            for (a, al, t), paths in index.items():
-                if a == norm_artist and t == norm_title:
-                    matches.extend(paths)
+            matches.extend(artist_title_to_paths.get((norm_artist, norm_title), []))
             
             # Also try with extracted track names
             if not matches:
-                title_tokens = set(norm_title.split())
-                for (a, al, t), paths in index.items():
-                    if a == norm_artist:
-                        track_tokens = set(t.split())
-                        # If all title tokens are in track name, it's a match
-                        if title_tokens and title_tokens.issubset(track_tokens) and len(title_tokens) >= 2:
+                for al, t, track_tokens, paths in artist_entries.get(norm_artist, ()):
+                    # If all title tokens are in track name, it's a match
+                    if title_tokens and title_tokens.issubset(track_tokens) and len(title_tokens) >= 2:
+                        matches.extend(paths)
+                    # Or if track tokens are subset of title (handles parenthetical content)
+                    elif track_tokens.issubset(title_tokens) and len(track_tokens) >= 2:
+                        matches.extend(paths)
+                    # Or significant token overlap
+                    elif title_tokens and track_tokens:
+                        overlap = len(title_tokens & track_tokens)
+                        min_len = min(len(title_tokens), len(track_tokens))
+                        if min_len >= 2 and overlap >= (min_len * 2 // 3):
                             matches.extend(paths)
-                        # Or if track tokens are subset of title (handles parenthetical content)
-                        elif track_tokens.issubset(title_tokens) and len(track_tokens) >= 2:
-                            matches.extend(paths)
-                        # Or significant token overlap
-                        elif title_tokens and track_tokens:
-                            overlap = len(title_tokens & track_tokens)
-                            min_len = min(len(title_tokens), len(track_tokens))
-                            if min_len >= 2 and overlap >= (min_len * 2 // 3):
-                                matches.extend(paths)
         
         # Strategy 7: Check Various Artists / Compilation albums
         # Handles cases where tracks are in compilation albums under "Various Artists" or similar
         if not matches:
-            # Common variations of "Various Artists" folder names
-            various_artists_names = [
-                "various artists",
-                "various",
-                "va",
-                "compilation",
-                "compilations",
-                "soundtrack",
-                "soundtracks",
-                "ost",
-            ]
-            
             # Try matching track in Various Artists folders with same album
-            for va_name in various_artists_names:
-                norm_va = _norm(va_name)
+            for norm_va in _VARIOUS_ARTISTS_NAMES:
+                # Most libraries have at most one of these folders; skip the rest outright
+                if norm_va not in artist_entries:
+                    continue
                 # Try with album match first
                 for alt_album in [norm_album, norm_album_flexible]:
                     if alt_album:
                         key_va = (norm_va, alt_album, norm_title)
-                        matches.extend(index.get(key_va, []))
+                        matches.extend(index.get(key_va, ()))
                         
                         # Also try with extracted track name
-                        extracted_playlist_title = _extract_track_name_from_filename(title, artist)
                         if extracted_playlist_title != norm_title:
                             key_va_extracted = (norm_va, alt_album, extracted_playlist_title)
-                            matches.extend(index.get(key_va_extracted, []))
+                            matches.extend(index.get(key_va_extracted, ()))
                 
                 # If no album match, try just track name match in Various Artists
                 if not matches:
-                    for (a, al, t), paths in index.items():
-                        if a == norm_va and t == norm_title:
-                            matches.extend(paths)
+                    matches.extend(artist_title_to_paths.get((norm_va, norm_title), []))
                     
                     # Also try token-based matching
                     if not matches:
-                        title_tokens = set(norm_title.split())
-                        for (a, al, t), paths in index.items():
-                            if a == norm_va:
-                                track_tokens = set(t.split())
-                                # If all title tokens are in track name, it's a match
-                                if title_tokens and title_tokens.issubset(track_tokens) and len(title_tokens) >= 2:
-                                    matches.extend(paths)
-                                # Or if track tokens are subset of title
-                                elif track_tokens.issubset(title_tokens) and len(track_tokens) >= 2:
-                                    matches.extend(paths)
+                        for al, t, track_tokens, paths in artist_entries.get(norm_va, ()):
+                            # If all title tokens are in track name, it's a match
+                            if title_tokens and title_tokens.issubset(track_tokens) and len(title_tokens) >= 2:
+                                matches.extend(paths)
+                            # Or if track tokens are subset of title
+                            elif track_tokens.issubset(title_tokens) and len(track_tokens) >= 2:
+                                matches.extend(paths)
                 
                 # If we found matches, stop checking other VA variations
                 if matches:
                     break
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_matches = []
-        for p in matches:
-            if p not in seen:
-                seen.add(p)
-                unique_matches.append(p)
-        matches = unique_matches
+        matches = list(dict.fromkeys(matches))
 
         item: Dict[str, Any] = {
             "time": track.get("time"),
@@ -439,20 +754,35 @@ def match_playlist_to_library(
             # Candidate strategy:
             # - look within same (artist, album) if possible
             # - score by overlap between normalized strings
-            aa_key = (_norm(artist), _norm(album))
-            candidates = artist_album_to_paths.get(aa_key, [])
-
-            # Simple similarity: track token overlap (cheap & decent)
-            want_tokens = set(_norm(title).split())
-            scored: List[Tuple[int, Path]] = []
-            for p in candidates:
-                have_tokens = set(_norm(p.stem).split())
-                score = len(want_tokens & have_tokens)
-                if score > 0:
-                    scored.append((score, p))
-            
-            scored.sort(key=lambda x: x[0], reverse=True)
-            item["candidate_paths"] = [str(p) for _score, p in scored[:max_candidates]]
+            aa_key = (norm_artist, norm_album)
+            # A file sits under several alternative index keys; suggest it only once
+            candidates = list(dict.fromkeys(artist_album_to_paths.get(aa_key, [])))
+
+            if RAPIDFUZZ_AVAILABLE:
+                # C-level token-set similarity, ranked and cut off in one call
+                best = process.extract(
+                    norm_title,
+                    [_norm(p.stem) for p in candidates],
+                    scorer=fuzz.token_set_ratio,
+                    limit=max_candidates,
+                    score_cutoff=CANDIDATE_SCORE_CUTOFF,
+                )
+                item["candidate_paths"] = [str(candidates[i]) for _choice, _score, i in best]
+            else:
+                # Simple similarity: track token overlap (cheap & decent)
+                want_tokens = title_tokens
+                scored: List[Tuple[int, Path]] = []
+                for p in candidates:
+                    have_tokens = stem_tokens.get(p)
+                    if have_tokens is None:
+                        have_tokens = stem_tokens[p] = frozenset(_norm(p.stem).split())
+                    score = len(want_tokens & have_tokens)
+                    if score > 0:
+                        scored.append((score, p))
+                
+                # Top-k without sorting everything (same order as a stable descending sort)
+                top = heapq.nlargest(max_candidates, scored, key=lambda x: x[0])
+                item["candidate_paths"] = [str(p) for _score, p in top]
 
         results.append(item)
 
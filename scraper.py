@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 
+# Only probe for lxml here; BeautifulSoup imports it when it builds a tree
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+
+# lxml is a C parser; html.parser is pure Python but always available
+HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
 
 def _txt(el) -> Optional[str]:
     """Safe text extractor with stripping."""
@@ -19,10 +28,22 @@ def _txt(el) -> Optional[str]:
     return s or None
 
 
+@lru_cache(maxsize=None)
+def _compile_selectors(selectors: Tuple[str, ...]) -> Tuple[soupsieve.SoupSieve, Tuple[soupsieve.SoupSieve, ...]]:
+    """Compile CSS selectors once (combined and one by one); extract_from_row reuses them for every row."""
+    return soupsieve.compile(", ".join(selectors)), tuple(soupsieve.compile(sel) for sel in selectors)
+
+
 def _first(soup: BeautifulSoup, selectors: List[str]):
-    """Return the first element matching any selector."""
-    for sel in selectors:
-        el = soup.select_one(sel)
+    """Return the first element matching any selector (earlier selectors win)."""
+    combined, individual = _compile_selectors(tuple(selectors))
+    # One pass finds the first element in document order matching any selector.
+    # No hit means no selector matches; a hit matching the top selector is also its first match.
+    el = combined.select_one(soup)
+    if el is None or individual[0].match(el):
+        return el
+    for sel in individual:
+        el = sel.select_one(soup)
         if el is not None:
             return el
     return None
@@ -46,7 +67,7 @@ def playlist_scraper(url: str, timeout: int = 30) -> Dict[str, Any]:
     resp = requests.get(url, headers=headers, timeout=timeout)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, HTML_PARSER)
 
     # --- META ---
     fetched_at = datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+import match_playlist_to_library
+
+
+@pytest.fixture(autouse=True)
+def index_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep library index caches out of the real per-user cache folder."""
+    cache_dir = tmp_path_factory.mktemp("index_cache")
+    monkeypatch.setattr(match_playlist_to_library, "INDEX_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def shared_library(tmp_path_factory):
+    """Library tree (Artist/Album/Track.ext) built once per test session.
+
+    Treat it as read-only: tests that add, remove, or rename files must build their own.
+    """
+    root = tmp_path_factory.mktemp("library")
+    album_dir = root / "Test Artist" / "Test Album"
+    album_dir.mkdir(parents=True)
+    (album_dir / "Test Song.mp3").touch()
+    return root
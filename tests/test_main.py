@@ -5,8 +5,11 @@ To run: pytest test_main.py -v
 To run specific test: pytest test_main.py::TestSafeSlug::test_safe_slug_basic -v
 """
 
+import importlib
 import json
-import tempfile
+import os
+import threading
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pytest
@@ -20,8 +23,21 @@ from main import (
     validate_file_path,
     validate_json_file,
     list_artifacts,
-    ARTIFACTS_DIR,
+    find_recent_playlist_artifact,
+    parse_args,
+    prompt_user,
+    prompt_yes_no,
+    confirm_skip_tracks,
+    fetch_links_for_tracks,
+    iter_links_for_tracks,
+    remove_skipped_tracks,
+    create_artist_directories,
+    run_scrape,
+    run_match,
+    run_links,
+    run_export,
 )
+from main import main as main_entry
 
 
 class TestSafeSlug:
@@ -82,15 +98,18 @@ class TestDeriveArtifactStem:
         assert stem.startswith("2025-12-17_")
         assert "my-awesome-playlist" in stem
 
-    def test_derive_artifact_stem_fallback_date(self):
+    def test_derive_artifact_stem_fallback_date(self, monkeypatch):
         """Test artifact stem uses today's date if fetched_at_utc missing"""
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2025, 1, 1, 12, 0, 0)
+
+        monkeypatch.setattr("main.datetime", FrozenDatetime)
         meta = {
             "playlist_title": "Test Playlist",
         }
-        stem = derive_artifact_stem(meta)
-        # Should have date prefix (format: YYYY-MM-DD_)
-        assert len(stem) > len("test-playlist")
-        assert stem.count("-") >= 2  # Date has dashes
+        assert derive_artifact_stem(meta) == "2025-01-01_test-playlist"
 
     def test_derive_artifact_stem_minimal_meta(self):
         """Test artifact stem with minimal metadata"""
@@ -102,26 +121,24 @@ class TestDeriveArtifactStem:
 class TestJsonIO:
     """Tests for load_json and save_json functions"""
 
-    def test_save_and_load_json(self):
+    def test_save_and_load_json(self, tmp_path):
         """Test saving and loading JSON"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            test_file = tmp_path / "test.json"
-            
-            test_data = {
-                "meta": {"title": "Test"},
-                "tracks": [{"artist": "Artist", "song": "Song"}],
-            }
-            
-            # Save JSON
-            saved_path = save_json(test_data, test_file)
-            assert saved_path == test_file
-            assert test_file.exists()
-            
-            # Load JSON
-            loaded_data = load_json(test_file)
-            assert loaded_data == test_data
-            assert loaded_data["meta"]["title"] == "Test"
+        test_file = tmp_path / "test.json"
+        
+        test_data = {
+            "meta": {"title": "Test"},
+            "tracks": [{"artist": "Artist", "song": "Song"}],
+        }
+        
+        # Save JSON
+        saved_path = save_json(test_data, test_file)
+        assert saved_path == test_file
+        assert test_file.exists()
+        
+        # Load JSON
+        loaded_data = load_json(test_file)
+        assert loaded_data == test_data
+        assert loaded_data["meta"]["title"] == "Test"
 
     def test_load_json_nonexistent(self):
         """Test loading nonexistent JSON raises FileNotFoundError"""
@@ -129,17 +146,15 @@ class TestJsonIO:
         with pytest.raises(FileNotFoundError):
             load_json(nonexistent)
 
-    def test_save_json_creates_directory(self):
+    def test_save_json_creates_directory(self, tmp_path):
         """Test that save_json creates parent directories"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            nested_file = tmp_path / "nested" / "dir" / "test.json"
-            
-            test_data = {"test": "data"}
-            save_json(test_data, nested_file)
-            
-            assert nested_file.exists()
-            assert load_json(nested_file) == test_data
+        nested_file = tmp_path / "nested" / "dir" / "test.json"
+        
+        test_data = {"test": "data"}
+        save_json(test_data, nested_file)
+        
+        assert nested_file.exists()
+        assert load_json(nested_file) == test_data
 
 
 class TestValidateUrl:
@@ -175,15 +190,12 @@ class TestValidateUrl:
 class TestValidateFilePath:
     """Tests for validate_file_path function"""
 
-    def test_validate_file_path_existing(self):
+    def test_validate_file_path_existing(self, tmp_path):
         """Test validating existing file"""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            try:
-                result = validate_file_path(tmp_path, "file")
-                assert result == tmp_path.resolve()
-            finally:
-                tmp_path.unlink()
+        file_path = tmp_path / "file.txt"
+        file_path.touch()
+        result = validate_file_path(file_path, "file")
+        assert result == file_path.resolve()
 
     def test_validate_file_path_nonexistent(self):
         """Test validating nonexistent file raises FileNotFoundError"""
@@ -191,414 +203,687 @@ class TestValidateFilePath:
         with pytest.raises(FileNotFoundError):
             validate_file_path(nonexistent, "file")
 
-    def test_validate_file_path_expands_user(self):
+    def test_validate_file_path_expands_user(self, tmp_path, monkeypatch):
         """Test that ~ is expanded"""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            try:
-                # Test with expanded path (validate_file_path should handle it)
-                result = validate_file_path(tmp_path, "file")
-                assert result == tmp_path.resolve()
-            finally:
-                tmp_path.unlink()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))  # Windows
+        file_path = tmp_path / "file.txt"
+        file_path.touch()
+        result = validate_file_path(Path("~/file.txt"), "file")
+        assert result == file_path.resolve()
 
 
 class TestValidateJsonFile:
     """Tests for validate_json_file function"""
 
-    def test_validate_json_file_valid_playlist(self):
+    def test_validate_json_file_valid_playlist(self, tmp_path):
         """Test validating valid playlist JSON"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            json.dump({
-                "meta": {"title": "Test"},
-                "tracks": [{"artist": "Artist", "song": "Song"}],
-            }, tmp)
-            tmp_path = Path(tmp.name)
+        json_path = tmp_path / "test.json"
+        json_path.write_text(json.dumps({
+            "meta": {"title": "Test"},
+            "tracks": [{"artist": "Artist", "song": "Song"}],
+        }))
         
-        try:
-            result = validate_json_file(tmp_path, "playlist")
-            assert "meta" in result
-            assert "tracks" in result
-        finally:
-            tmp_path.unlink()
+        result = validate_json_file(json_path, "playlist")
+        assert "meta" in result
+        assert "tracks" in result
 
-    def test_validate_json_file_valid_match(self):
+    def test_validate_json_file_valid_match(self, tmp_path):
         """Test validating valid match JSON"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            json.dump({
-                "summary": {"found": 5, "missing": 2},
-                "results": [{"match_status": "found"}],
-            }, tmp)
-            tmp_path = Path(tmp.name)
+        json_path = tmp_path / "test.json"
+        json_path.write_text(json.dumps({
+            "summary": {"found": 5, "missing": 2},
+            "results": [{"match_status": "found"}],
+        }))
         
-        try:
-            result = validate_json_file(tmp_path, "match")
-            assert "summary" in result
-            assert "results" in result
-        finally:
-            tmp_path.unlink()
+        result = validate_json_file(json_path, "match")
+        assert "summary" in result
+        assert "results" in result
 
-    def test_validate_json_file_invalid_structure(self):
+    def test_validate_json_file_invalid_structure(self, tmp_path):
         """Test validating JSON with wrong structure raises ValueError"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            json.dump({"wrong": "structure"}, tmp)
-            tmp_path = Path(tmp.name)
+        json_path = tmp_path / "test.json"
+        json_path.write_text(json.dumps({"wrong": "structure"}))
         
-        try:
-            with pytest.raises(ValueError, match="does not appear to be"):
-                validate_json_file(tmp_path, "playlist")
-        finally:
-            tmp_path.unlink()
+        with pytest.raises(ValueError, match="does not appear to be"):
+            validate_json_file(json_path, "playlist")
 
-    def test_validate_json_file_invalid_json(self):
+    def test_validate_json_file_invalid_json(self, tmp_path):
         """Test validating invalid JSON raises JSONDecodeError"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            tmp.write("not valid json {")
-            tmp_path = Path(tmp.name)
+        json_path = tmp_path / "test.json"
+        json_path.write_text("not valid json {")
         
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                validate_json_file(tmp_path, "playlist")
-        finally:
-            tmp_path.unlink()
+        with pytest.raises(json.JSONDecodeError):
+            validate_json_file(json_path, "playlist")
 
 
 class TestListArtifacts:
     """Tests for list_artifacts function"""
 
-    def test_list_artifacts_empty(self):
+    def test_list_artifacts_empty(self, tmp_path, monkeypatch):
         """Test listing artifacts when directory doesn't exist"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            # Temporarily patch ARTIFACTS_DIR
-            original_dir = ARTIFACTS_DIR
-            try:
-                import main
-                main.ARTIFACTS_DIR = artifacts_dir
-                artifacts = list_artifacts()
-                assert artifacts == []
-            finally:
-                main.ARTIFACTS_DIR = original_dir
-
-    def test_list_artifacts_sorted_by_mtime(self):
+        artifacts_dir = tmp_path / "artifacts"
+        # Temporarily patch ARTIFACTS_DIR (restored by monkeypatch)
+        monkeypatch.setattr("main.ARTIFACTS_DIR", artifacts_dir)
+        artifacts = list_artifacts()
+        assert artifacts == []
+
+    def test_list_artifacts_sorted_by_mtime(self, tmp_path, monkeypatch):
         """Test that artifacts are sorted by modification time (newest first)"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            
-            # Create test files with delays to ensure different mtimes
-            import time
-            file1 = artifacts_dir / "old.playlist.json"
-            file1.touch()
-            time.sleep(0.01)  # Small delay
-            
-            file2 = artifacts_dir / "new.playlist.json"
-            file2.touch()
-            
-            original_dir = ARTIFACTS_DIR
-            try:
-                import main
-                main.ARTIFACTS_DIR = artifacts_dir
-                
-                artifacts = list_artifacts("playlist")
-                assert len(artifacts) == 2
-                # Newest should be first
-                assert artifacts[0].name == "new.playlist.json"
-                assert artifacts[1].name == "old.playlist.json"
-            finally:
-                main.ARTIFACTS_DIR = original_dir
-
-    def test_list_artifacts_with_files(self):
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        
+        # Create test files with explicit, distinct mtimes
+        file1 = artifacts_dir / "old.playlist.json"
+        file1.touch()
+        os.utime(file1, (1000, 1000))
+        
+        file2 = artifacts_dir / "new.playlist.json"
+        file2.touch()
+        os.utime(file2, (2000, 2000))
+        
+        monkeypatch.setattr("main.ARTIFACTS_DIR", artifacts_dir)
+        
+        artifacts = list_artifacts("playlist")
+        assert len(artifacts) == 2
+        # Newest should be first
+        assert artifacts[0].name == "new.playlist.json"
+        assert artifacts[1].name == "old.playlist.json"
+
+    def test_list_artifacts_sorts_many_by_mtime(self, tmp_path, monkeypatch):
+        """Test mtime ordering on a larger directory whose name order differs from mtime order"""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+
+        count = 100
+        mtimes = {}
+        for i in range(count):
+            f = artifacts_dir / f"{i:03d}.playlist.json"
+            f.touch()
+            mtimes[f.name] = 1000 + (i * 37) % count  # distinct, scrambled relative to names
+            os.utime(f, (mtimes[f.name], mtimes[f.name]))
+        (artifacts_dir / "999.match.json").touch()  # Different type, filtered out
+
+        monkeypatch.setattr("main.ARTIFACTS_DIR", artifacts_dir)
+
+        names = [a.name for a in list_artifacts("playlist")]
+        assert names == sorted(mtimes, key=mtimes.get, reverse=True)
+
+    def test_list_artifacts_with_files(self, tmp_path, monkeypatch):
         """Test listing artifacts with files"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            
-            # Create test files
-            (artifacts_dir / "2025-12-17_test.playlist.json").touch()
-            (artifacts_dir / "2025-12-17_test.match.json").touch()
-            (artifacts_dir / "2025-12-17_test.enriched.json").touch()
-            (artifacts_dir / "other.txt").touch()  # Should be filtered out
-            
-            original_dir = ARTIFACTS_DIR
-            try:
-                import main
-                main.ARTIFACTS_DIR = artifacts_dir
-                
-                # List all artifacts
-                all_artifacts = list_artifacts()
-                assert len(all_artifacts) == 3  # Only JSON files
-                
-                # List playlist artifacts only
-                playlist_artifacts = list_artifacts("playlist")
-                assert len(playlist_artifacts) == 1
-                assert playlist_artifacts[0].name.endswith(".playlist.json")
-                
-                # List match artifacts only
-                match_artifacts = list_artifacts("match")
-                assert len(match_artifacts) == 1
-                assert match_artifacts[0].name.endswith(".match.json")
-            finally:
-                main.ARTIFACTS_DIR = original_dir
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        
+        # Create test files
+        (artifacts_dir / "2025-12-17_test.playlist.json").touch()
+        (artifacts_dir / "2025-12-17_test.match.json").touch()
+        (artifacts_dir / "2025-12-17_test.enriched.json").touch()
+        (artifacts_dir / "other.txt").touch()  # Should be filtered out
+        
+        monkeypatch.setattr("main.ARTIFACTS_DIR", artifacts_dir)
+        
+        # List all artifacts
+        all_artifacts = list_artifacts()
+        assert len(all_artifacts) == 3  # Only JSON files
+        
+        # List playlist artifacts only
+        playlist_artifacts = list_artifacts("playlist")
+        assert len(playlist_artifacts) == 1
+        assert playlist_artifacts[0].name.endswith(".playlist.json")
+        
+        # List match artifacts only
+        match_artifacts = list_artifacts("match")
+        assert len(match_artifacts) == 1
+        assert match_artifacts[0].name.endswith(".match.json")
+
+
+class TestFindRecentPlaylistArtifact:
+    """Tests for find_recent_playlist_artifact"""
+
+    def test_find_recent_playlist_artifact(self, tmp_path):
+        """Test that a fresh, unedited scrape of the same URL is found for reuse"""
+        artifacts_dir = tmp_path
+        url = "https://playlists.wprb.com/test"
+        save_json({"meta": {"source_url": url}, "tracks": []},
+                  artifacts_dir / "2024-01-01_test.playlist.json")
+        save_json({"meta": {"source_url": url, "tracks_skipped": 2}, "tracks": []},
+                  artifacts_dir / "2024-01-01_edited.playlist.json")
+
+        data, path = find_recent_playlist_artifact(url, artifacts_dir)
+        assert path.name == "2024-01-01_test.playlist.json"
+        assert data["meta"]["source_url"] == url
+
+        assert find_recent_playlist_artifact("https://other.com", artifacts_dir) == (None, None)
+
+
+class TestNonInteractiveMode:
+    """Tests for --yes / non-interactive prompt handling"""
+
+    def test_parse_args_defaults(self):
+        """Test that no arguments means interactive menu mode"""
+        args = parse_args([])
+        assert args.url is None
+        assert args.yes is False
+        assert args.skip_missing is False
+
+    def test_parse_args_headless(self):
+        """Test parsing of headless pipeline flags"""
+        args = parse_args([
+            "--url", "https://playlists.wprb.com/test",
+            "--library", "/music",
+            "--target", "/out",
+            "--yes",
+            "--skip-missing",
+        ])
+        assert args.url == "https://playlists.wprb.com/test"
+        assert args.library == "/music"
+        assert args.target == "/out"
+        assert args.yes is True
+        assert args.skip_missing is True
+
+    def test_prompts_return_defaults_without_input(self):
+        """Test that prompts never call input() when ASSUME_YES is set"""
+        with patch("main.ASSUME_YES", True), patch("builtins.input") as mock_input:
+            assert prompt_user("Playlist name", "lady-love") == "lady-love"
+            assert prompt_user("Tracks to keep", "") == ""
+            assert prompt_yes_no("Continue?", default=True) is True
+            assert prompt_yes_no("Overwrite?", default=False) is False
+            mock_input.assert_not_called()
+
+    def test_prompt_without_default_exits_in_yes_mode(self):
+        """Test that a prompt with no default exits instead of re-prompting forever"""
+        with patch("main.ASSUME_YES", True), patch("builtins.input") as mock_input:
+            with pytest.raises(SystemExit) as exc:
+                prompt_user("Enter playlist URL")
+            assert exc.value.code == 1
+            mock_input.assert_not_called()
+
+    def test_main_rejects_yes_without_url(self):
+        """Test that --yes without --url exits instead of driving the menu"""
+        with patch("main.run_main_menu_loop") as mock_menu:
+            with pytest.raises(SystemExit) as exc:
+                main_entry(["--yes"])
+            assert exc.value.code == 2
+            mock_menu.assert_not_called()
+
+    def test_main_creates_nested_artifacts_dir(self, tmp_path, monkeypatch):
+        """Test that SPINDLE_ARTIFACTS_DIR may point at a directory whose parents don't exist yet"""
+        import main as main_module
+
+        artifacts_dir = tmp_path / "a" / "b"
+        monkeypatch.setenv("SPINDLE_ARTIFACTS_DIR", str(artifacts_dir))
+        importlib.reload(main_module)  # ARTIFACTS_DIR is read at import time
+        try:
+            assert main_module.ARTIFACTS_DIR == artifacts_dir
+            with patch.object(main_module, "run_main_menu_loop") as mock_menu:
+                main_module.main([])
+            mock_menu.assert_called_once()
+            assert artifacts_dir.is_dir()
+        finally:
+            monkeypatch.delenv("SPINDLE_ARTIFACTS_DIR")
+            importlib.reload(main_module)
+
+
+class TestLinkLookups:
+    """Tests for concurrent link lookups"""
+
+    def test_link_session_created_on_first_use(self, monkeypatch):
+        """Test that the shared session is only built when a lookup first needs it"""
+        import main as main_module
+
+        monkeypatch.setattr(main_module, "_link_session", None)
+        with patch("main.create_session") as mock_create, patch("main.atexit.register") as mock_register:
+            first = main_module._get_link_session()
+            second = main_module._get_link_session()
+        assert first is second is mock_create.return_value
+        mock_create.assert_called_once()
+        mock_register.assert_called_once_with(first.close)
+
+    @patch("main.load_cache", return_value={})
+    def test_fetch_links_preserves_order_and_failures(self, mock_cache):
+        """Test that results line up with input tracks and failed lookups become None"""
+        def fake_lookup(track_meta, session=None, use_cache=True, cache=None):
+            if track_meta.artist == "Broken":
+                raise RuntimeError("network down")
+            return {"ok": True, "artist": track_meta.artist}
+
+        tracks = [{"artist": a, "song": "Song"} for a in ["A", "Broken", "C"]]
+        with patch("main.find_share_urls_from_metadata", side_effect=fake_lookup):
+            results = fetch_links_for_tracks(tracks, session=Mock())
+
+        assert results[0]["artist"] == "A"
+        assert results[1] is None
+        assert results[2]["artist"] == "C"
+
+    @patch("main.load_cache", return_value={})
+    def test_fetch_links_dedupes_repeated_tracks(self, mock_cache):
+        """Test that a track played twice is only looked up once"""
+        tracks = [
+            {"artist": "A", "song": "Song"},
+            {"artist": "B", "song": "Other"},
+            {"artist": "A", "song": "Song"},
+        ]
+        with patch("main.find_share_urls_from_metadata", return_value={"ok": False}) as mock_links:
+            results = fetch_links_for_tracks(tracks, session=Mock())
+
+        assert len(results) == 3
+        assert mock_links.call_count == 2
+
+    @patch("main.LINK_LOOKUP_WORKERS", 1)
+    @patch("main.load_cache", return_value={})
+    def test_iter_links_stops_queued_lookups_when_closed(self, mock_cache):
+        """Test that closing the generator early cancels lookups that have not started"""
+        release = threading.Event()
+
+        def slow_lookup(track_meta, session=None, use_cache=True, cache=None):
+            if track_meta.artist != "A":
+                release.wait(5)
+            return {"ok": False}
+
+        tracks = [{"artist": a, "song": "Song"} for a in ["A", "B", "C", "D", "E"]]
+        with patch("main.find_share_urls_from_metadata", side_effect=slow_lookup) as mock_links:
+            links = iter_links_for_tracks(tracks, Mock())
+            assert next(links) == {"ok": False}
+            links.close()  # Returns without waiting for the blocked lookup
+            release.set()
+
+        # Only the finished lookup and at most the one in flight ever ran
+        assert mock_links.call_count <= 2
+
+
+class TestConfirmSkipTracks:
+    """Tests for the batched skip confirmation prompt"""
+
+    @pytest.fixture
+    def still_missing(self):
+        return [
+            {"artist": "Artist A", "song": "Song A"},
+            {"artist": "Artist B", "song": "Song B"},
+        ]
+
+    @patch("main.find_share_urls_from_metadata", return_value={"ok": False})
+    def test_blank_response_skips_all(self, mock_links, still_missing):
+        """Test that a blank answer skips every track with a single prompt"""
+        with patch("builtins.input", return_value="") as mock_input:
+            assert confirm_skip_tracks(still_missing) == still_missing
+            assert mock_input.call_count == 1
+
+    @patch("main.find_share_urls_from_metadata", return_value={"ok": False})
+    def test_reuses_prefetched_links(self, mock_links, still_missing):
+        """Test that links already fetched for the missing-tracks display are not looked up again"""
+        links_by_key = {
+            ("Artist A", "Song A", None): {"ok": False},
+            ("Artist B", "Song B", None): {"ok": False},
+        }
+        with patch("builtins.input", return_value=""):
+            confirm_skip_tracks(still_missing, links_by_key)
+        mock_links.assert_not_called()
+
+    @patch("main.find_share_urls_from_metadata", return_value={"ok": False})
+    def test_keeping_any_track_cancels(self, mock_links, still_missing):
+        """Test that listing a track number to keep cancels the operation"""
+        with patch("builtins.input", return_value="2"):
+            assert confirm_skip_tracks(still_missing) is None
+
+    @patch("main.find_share_urls_from_metadata", return_value={"ok": False})
+    def test_invalid_answer_reprompts(self, mock_links, still_missing):
+        """Test that unparseable or out-of-range numbers are rejected instead of skipping everything"""
+        with patch("builtins.input", side_effect=["1 2", "1-2", "3", "0", "2"]) as mock_input:
+            assert confirm_skip_tracks(still_missing) is None
+            assert mock_input.call_count == 5
+
+    @patch("main.find_share_urls_from_metadata", return_value={"ok": False})
+    def test_editor_batch_mode(self, mock_links, monkeypatch):
+        """Test that tracks marked [x] in the editor checklist are kept"""
+        monkeypatch.setenv("EDITOR", "code --wait")
+        still_missing = [{"artist": f"Artist {i}", "song": f"Song {i}"} for i in range(12)]
+
+        def fake_editor(cmd):
+            assert cmd[:2] == ["code", "--wait"]
+            path = Path(cmd[-1])
+            path.write_text(path.read_text().replace("[ ] 3.", "[x] 3."))
+            return 0
+
+        with patch("builtins.input", return_value="y"), \
+                patch("main.subprocess.call", side_effect=fake_editor) as mock_editor:
+            assert confirm_skip_tracks(still_missing) is None
+            mock_editor.assert_called_once()
+
+    def _confirm_with_failed_editor(self, editor_effect):
+        """Open the editor (answer "y"), then keep track 3 at the fallback prompt"""
+        still_missing = [{"artist": f"Artist {i}", "song": f"Song {i}"} for i in range(12)]
+        with patch("main.find_share_urls_from_metadata", return_value={"ok": False}), \
+                patch("builtins.input", side_effect=["y", "3"]) as mock_input, \
+                patch("main.subprocess.call", side_effect=editor_effect):
+            assert confirm_skip_tracks(still_missing) is None
+            assert mock_input.call_count == 2
+
+    def test_missing_editor_falls_back_to_prompt(self):
+        """Test that an editor that cannot be started does not skip everything"""
+        self._confirm_with_failed_editor(FileNotFoundError("vi"))
+
+    def test_failing_editor_falls_back_to_prompt(self):
+        """Test that a non-zero editor exit does not skip everything"""
+        self._confirm_with_failed_editor(lambda cmd: 1)
+
+    def test_unsaved_checklist_falls_back_to_prompt(self):
+        """Test that quitting the editor without changes does not skip everything"""
+        self._confirm_with_failed_editor(lambda cmd: 0)
+
+
+class TestRemoveSkippedTracks:
+    """Tests for remove_skipped_tracks"""
+
+    def test_remove_skipped_tracks(self):
+        """Test that skipped tracks are dropped in order and track_count is updated"""
+        playlist_data = {
+            "meta": {"track_count": 3},
+            "tracks": [
+                {"artist": "A", "song": "1"},
+                {"artist": "B", "song": "2"},
+                {"artist": "C", "song": "3"},
+            ],
+        }
+        remove_skipped_tracks(playlist_data, [{"artist": "B", "song": "2"}])
+        assert [t["artist"] for t in playlist_data["tracks"]] == ["A", "C"]
+        assert playlist_data["meta"]["track_count"] == 2
+
+    def test_remove_skipped_tracks_missing_fields(self):
+        """Test that hand-edited tracks without artist/song do not raise"""
+        playlist_data = {
+            "meta": {"track_count": 2},
+            "tracks": [{"artist": "A"}, {"artist": "B", "song": "2"}],
+        }
+        remove_skipped_tracks(playlist_data, [{"artist": "A", "song": ""}])
+        assert playlist_data["tracks"] == [{"artist": "B", "song": "2"}]
+        assert playlist_data["meta"]["tracks_skipped"] == 1
+
+
+class TestCreateArtistDirectories:
+    """Tests for create_artist_directories"""
+
+    def test_creates_only_new_artists(self, capsys, tmp_path):
+        """Test that existing artist folders are skipped and new ones created"""
+        library_root = tmp_path
+        (library_root / "Existing Artist").mkdir()
+        missing = [
+            {"artist": "Existing Artist", "song": "A"},
+            {"artist": "New Artist", "song": "B"},
+            {"artist": "New Artist", "song": "C"},
+        ]
+
+        with patch("main.prompt_yes_no", return_value=True):
+            create_artist_directories(missing, library_root)
+
+        assert (library_root / "New Artist").is_dir()
+        out = capsys.readouterr().out
+        assert "Created 1 artist directories" in out
+        assert "1 artist directories already exist" in out
+
+    def test_yes_mode_leaves_library_untouched(self, tmp_path):
+        """Test that --yes does not create folders in the library by default"""
+        missing = [{"artist": "New Artist", "song": "B"}]
+
+        with patch("main.ASSUME_YES", True):
+            create_artist_directories(missing, tmp_path)
+
+        assert not (tmp_path / "New Artist").exists()
 
 
 class TestStageFunctions:
     """Tests for stage functions (run_scrape, run_match, run_links, run_export)"""
 
     @patch("main.playlist_scraper")
-    def test_run_scrape(self, mock_scraper):
+    def test_run_scrape(self, mock_scraper, tmp_path):
         """Test run_scrape function"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            
-            # Mock playlist data
-            mock_playlist_data = {
-                "meta": {
-                    "fetched_at_utc": "2025-12-17T10:30:00+00:00",
-                    "canonical_url": "https://playlists.wprb.com/test",
-                    "playlist_title": "Test Playlist",
-                    "track_count": 5,
-                },
-                "tracks": [
-                    {"artist": "Artist", "song": "Song"},
-                ],
-            }
-            mock_scraper.return_value = mock_playlist_data
-            
-            from main import run_scrape
-            result_path = run_scrape("https://playlists.wprb.com/test", artifacts_dir)
-            
-            assert result_path.exists()
-            assert result_path.suffix == ".json"
-            assert ".playlist.json" in result_path.name
-            
-            # Verify saved data
-            saved_data = load_json(result_path)
-            assert saved_data == mock_playlist_data
-            
-            mock_scraper.assert_called_once_with("https://playlists.wprb.com/test")
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        
+        # Mock playlist data
+        mock_playlist_data = {
+            "meta": {
+                "fetched_at_utc": "2025-12-17T10:30:00+00:00",
+                "canonical_url": "https://playlists.wprb.com/test",
+                "playlist_title": "Test Playlist",
+                "track_count": 5,
+            },
+            "tracks": [
+                {"artist": "Artist", "song": "Song"},
+            ],
+        }
+        mock_scraper.return_value = mock_playlist_data
+        
+        result_path = run_scrape("https://playlists.wprb.com/test", artifacts_dir)
+        
+        assert result_path.exists()
+        assert result_path.suffix == ".json"
+        assert ".playlist.json" in result_path.name
+        
+        # Verify saved data
+        saved_data = load_json(result_path)
+        assert saved_data == mock_playlist_data
+        
+        mock_scraper.assert_called_once_with("https://playlists.wprb.com/test")
 
     @patch("main.match_playlist_to_library")
-    def test_run_match(self, mock_match):
+    def test_run_match(self, mock_match, tmp_path):
         """Test run_match function"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            
-            # Create playlist JSON
-            playlist_data = {
-                "meta": {
-                    "fetched_at_utc": "2025-12-17T10:30:00+00:00",
-                    "canonical_url": "https://playlists.wprb.com/test",
-                },
-                "tracks": [{"artist": "Artist", "song": "Song"}],
-            }
-            playlist_path = artifacts_dir / "test.playlist.json"
-            save_json(playlist_data, playlist_path)
-            
-            # Mock match result
-            mock_match_result = {
-                "meta": playlist_data["meta"],
-                "summary": {"found": 1, "missing": 0, "total_tracks": 1},
-                "results": [{"match_status": "found"}],
-            }
-            mock_match.return_value = mock_match_result
-            
-            from main import run_match
-            result_path = run_match(
-                playlist_path,
-                str(Path(tmpdir)),
-                "",
-                artifacts_dir
-            )
-            
-            assert result_path.exists()
-            assert ".match.json" in result_path.name
-            
-            # Verify saved data includes playlist_data
-            saved_data = load_json(result_path)
-            assert "playlist_data" in saved_data
-            assert saved_data["playlist_data"] == playlist_data
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        
+        # Create playlist JSON
+        playlist_data = {
+            "meta": {
+                "fetched_at_utc": "2025-12-17T10:30:00+00:00",
+                "canonical_url": "https://playlists.wprb.com/test",
+            },
+            "tracks": [{"artist": "Artist", "song": "Song"}],
+        }
+        playlist_path = artifacts_dir / "test.playlist.json"
+        save_json(playlist_data, playlist_path)
+        
+        # Mock match result
+        mock_match_result = {
+            "meta": playlist_data["meta"],
+            "summary": {"found": 1, "missing": 0, "total_tracks": 1},
+            "results": [{"match_status": "found"}],
+        }
+        mock_match.return_value = mock_match_result
+        
+        result_path = run_match(
+            playlist_path,
+            str(tmp_path),
+            "",
+            artifacts_dir
+        )
+        
+        assert result_path.exists()
+        assert ".match.json" in result_path.name
+        
+        # Verify saved data includes playlist_data
+        saved_data = load_json(result_path)
+        assert "playlist_data" in saved_data
+        assert saved_data["playlist_data"] == playlist_data
 
     @patch("main.find_share_urls_from_metadata")
-    def test_run_links(self, mock_find_links):
+    def test_run_links(self, mock_find_links, tmp_path):
         """Test run_links function"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            
-            # Create match JSON
-            match_data = {
-                "meta": {"title": "Test"},
-                "summary": {"found": 1, "missing": 1, "total_tracks": 2},
-                "results": [
-                    {"match_status": "found", "artist": "Found", "song": "Song"},
-                    {"match_status": "missing", "artist": "Missing", "song": "Song"},
-                ],
-                "playlist_data": {
-                    "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
-                },
-            }
-            match_path = artifacts_dir / "test.match.json"
-            save_json(match_data, match_path)
-            
-            # Mock link finding
-            mock_find_links.return_value = {
-                "ok": True,
-                "aggregated": {
-                    "targets": {"amazon_music": "https://music.amazon.com/test"},
-                    "page_url": "https://song.link/test",
-                },
-                "seed": {"provider": "deezer"},
-            }
-            
-            from main import run_links
-            result_path = run_links(match_path, artifacts_dir, missing_only=True)
-            
-            assert result_path.exists()
-            assert ".enriched.json" in result_path.name or ".match.json" in result_path.name
-            
-            # Verify links were added to missing track
-            saved_data = load_json(result_path)
-            missing_track = next(r for r in saved_data["results"] if r["match_status"] == "missing")
-            assert "share_links" in missing_track
-            # Verify found track was not enriched (missing_only=True)
-            found_track = next(r for r in saved_data["results"] if r["match_status"] == "found")
-            # Found track may or may not have share_links, but shouldn't have been processed
-            assert mock_find_links.call_count == 1  # Only called for missing track
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        
+        # Create match JSON
+        match_data = {
+            "meta": {"title": "Test"},
+            "summary": {"found": 1, "missing": 1, "total_tracks": 2},
+            "results": [
+                {"match_status": "found", "artist": "Found", "song": "Song"},
+                {"match_status": "missing", "artist": "Missing", "song": "Song"},
+            ],
+            "playlist_data": {
+                "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
+            },
+        }
+        match_path = artifacts_dir / "test.match.json"
+        save_json(match_data, match_path)
+        
+        # Mock link finding
+        mock_find_links.return_value = {
+            "ok": True,
+            "aggregated": {
+                "targets": {"amazon_music": "https://music.amazon.com/test"},
+                "page_url": "https://song.link/test",
+            },
+            "seed": {"provider": "deezer"},
+        }
+        
+        result_path = run_links(match_path, artifacts_dir, missing_only=True)
+        
+        assert result_path.exists()
+        assert ".enriched.json" in result_path.name or ".match.json" in result_path.name
+        
+        # Verify links were added to missing track
+        saved_data = load_json(result_path)
+        missing_track = next(r for r in saved_data["results"] if r["match_status"] == "missing")
+        assert "share_links" in missing_track
+        # Verify found track was not enriched (missing_only=True)
+        found_track = next(r for r in saved_data["results"] if r["match_status"] == "found")
+        # Found track may or may not have share_links, but shouldn't have been processed
+        assert mock_find_links.call_count == 1  # Only called for missing track
 
     @patch("main.export_playlist_copies")
-    def test_run_export_from_match(self, mock_export):
+    def test_run_export_from_match(self, mock_export, tmp_path):
         """Test run_export function with match JSON"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            target_dir = Path(tmpdir) / "target"
-            target_dir.mkdir()
-            
-            # Create match JSON with playlist_data
-            match_data = {
-                "meta": {"title": "Test"},
-                "summary": {"found": 1, "missing": 0},
-                "results": [{"match_status": "found"}],
-                "playlist_data": {
-                    "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
-                    "tracks": [{"artist": "Artist", "song": "Song"}],
-                },
-            }
-            match_path = artifacts_dir / "test.match.json"
-            save_json(match_data, match_path)
-            
-            # Mock export result
-            mock_export.return_value = {
-                "summary": {"copied": 1, "total_tracks": 1},
-                "destination_folder": str(target_dir / "playlist"),
-            }
-            
-            from main import run_export
-            with patch("main.prompt_yes_no", return_value=False):  # Don't skip missing
-                result_path = run_export(
-                    match_path,
-                    str(Path(tmpdir)),
-                    "",
-                    target_dir,
-                    overwrite=False
-                )
-            
-            assert result_path.exists()
-            mock_export.assert_called_once()
-
-    @patch("main.export_playlist_copies")
-    def test_run_export_from_playlist(self, mock_export):
-        """Test run_export function with playlist JSON"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            target_dir = Path(tmpdir) / "target"
-            target_dir.mkdir()
-            
-            # Create playlist JSON
-            playlist_data = {
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        
+        # Create match JSON with playlist_data
+        match_data = {
+            "meta": {"title": "Test"},
+            "summary": {"found": 1, "missing": 0},
+            "results": [{"match_status": "found"}],
+            "playlist_data": {
                 "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
                 "tracks": [{"artist": "Artist", "song": "Song"}],
-            }
-            playlist_path = artifacts_dir / "test.playlist.json"
-            save_json(playlist_data, playlist_path)
-            
-            # Mock export result
-            mock_export.return_value = {
-                "summary": {"copied": 1, "total_tracks": 1},
-                "destination_folder": str(target_dir / "playlist"),
-            }
-            
-            from main import run_export
+            },
+        }
+        match_path = artifacts_dir / "test.match.json"
+        save_json(match_data, match_path)
+        
+        # Mock export result
+        mock_export.return_value = {
+            "summary": {"copied": 1, "total_tracks": 1},
+            "destination_folder": str(target_dir / "playlist"),
+        }
+        
+        with patch("main.prompt_yes_no", return_value=False):  # Don't skip missing
             result_path = run_export(
-                playlist_path,
-                str(Path(tmpdir)),
+                match_path,
+                str(tmp_path),
                 "",
                 target_dir,
                 overwrite=False
             )
-            
-            assert result_path.exists()
-            mock_export.assert_called_once()
-            
-            # Verify export was called with correct arguments
-            call_args = mock_export.call_args
-            assert call_args[1]["make_subfolder"] is True
-            assert call_args[1]["overwrite"] is False
+        
+        # The copy itself is mocked, so check the folder run_export reports
+        assert result_path == target_dir / "playlist"
+        mock_export.assert_called_once()
 
     @patch("main.export_playlist_copies")
-    def test_run_export_skips_missing_tracks(self, mock_export):
+    def test_run_export_from_playlist(self, mock_export, tmp_path):
+        """Test run_export function with playlist JSON"""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        
+        # Create playlist JSON
+        playlist_data = {
+            "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
+            "tracks": [{"artist": "Artist", "song": "Song"}],
+        }
+        playlist_path = artifacts_dir / "test.playlist.json"
+        save_json(playlist_data, playlist_path)
+        
+        # Mock export result
+        mock_export.return_value = {
+            "summary": {"copied": 1, "total_tracks": 1},
+            "destination_folder": str(target_dir / "playlist"),
+        }
+        
+        result_path = run_export(
+            playlist_path,
+            str(tmp_path),
+            "",
+            target_dir,
+            overwrite=False
+        )
+        
+        # The copy itself is mocked, so check the folder run_export reports
+        assert result_path == target_dir / "playlist"
+        
+        # Verify export was called once with correct arguments
+        mock_export.assert_called_once_with(
+            data=playlist_data,
+            base_folder=str(tmp_path),
+            target_dir=str(target_dir),
+            library_subpath="",
+            make_subfolder=True,
+            overwrite=False,
+        )
+
+    @patch("main.export_playlist_copies")
+    def test_run_export_skips_missing_tracks(self, mock_export, tmp_path):
         """Test run_export skips missing tracks when user confirms"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir) / "artifacts"
-            artifacts_dir.mkdir()
-            target_dir = Path(tmpdir) / "target"
-            target_dir.mkdir()
-            
-            # Create match JSON with missing tracks
-            match_data = {
-                "meta": {"title": "Test"},
-                "summary": {"found": 1, "missing": 1},
-                "results": [
-                    {"match_status": "found", "artist": "Found", "song": "Song"},
-                    {"match_status": "missing", "artist": "Missing", "song": "Song"},
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        
+        # Create match JSON with missing tracks
+        match_data = {
+            "meta": {"title": "Test"},
+            "summary": {"found": 1, "missing": 1},
+            "results": [
+                {"match_status": "found", "artist": "Found", "song": "Song"},
+                {"match_status": "missing", "artist": "Missing", "song": "Song"},
+            ],
+            "playlist_data": {
+                "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
+                "tracks": [
+                    {"artist": "Found", "song": "Song"},
+                    {"artist": "Missing", "song": "Song"},
                 ],
-                "playlist_data": {
-                    "meta": {"fetched_at_utc": "2025-12-17T10:30:00+00:00"},
-                    "tracks": [
-                        {"artist": "Found", "song": "Song"},
-                        {"artist": "Missing", "song": "Song"},
-                    ],
-                },
-            }
-            match_path = artifacts_dir / "test.match.json"
-            save_json(match_data, match_path)
-            
-            # Mock export result
-            mock_export.return_value = {
+            },
+        }
+        match_path = artifacts_dir / "test.match.json"
+        save_json(match_data, match_path)
+        
+        # Mock export result, recording only the artists of the tracks handed to export
+        exported_artists = []
+
+        def fake_export(data, **kwargs):
+            exported_artists.append([t["artist"] for t in data["tracks"]])
+            return {
                 "summary": {"copied": 1, "total_tracks": 1},
                 "destination_folder": str(target_dir / "playlist"),
             }
-            
-            from main import run_export
-            # User chooses to skip missing tracks
-            with patch("main.prompt_yes_no", return_value=True):
-                result_path = run_export(
-                    match_path,
-                    str(Path(tmpdir)),
-                    "",
-                    target_dir,
-                    overwrite=False
-                )
-            
-            # Verify export was called with filtered tracks
-            call_args = mock_export.call_args
-            playlist_data = call_args[0][0]  # First positional argument
-            assert len(playlist_data["tracks"]) == 1  # Missing track filtered out
-            assert playlist_data["tracks"][0]["artist"] == "Found"
+
+        mock_export.side_effect = fake_export
+        
+        # User chooses to skip missing tracks
+        with patch("main.prompt_yes_no", return_value=True):
+            result_path = run_export(
+                match_path,
+                str(tmp_path),
+                "",
+                target_dir,
+                overwrite=False
+            )
+        
+        # Verify export was called once, with the missing track filtered out
+        assert exported_artists == [["Found"]]
 
 
 if __name__ == "__main__":
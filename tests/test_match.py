@@ -1,66 +1,78 @@
-#!/usr/bin/env python3
-"""Test script for match_playlist_to_library function."""
+"""
+End-to-end test of match_playlist_to_library against the bundled sample playlist.
+
+To run: pytest test_match.py -v
+"""
 
 import json
+from pathlib import Path
+
+import pytest
+
 from match_playlist_to_library import match_playlist_to_library
 
-# Load sample playlist data
-with open("sample_data/sample_playlist_1", "r") as f:
-    playlist_data = json.load(f)
+SAMPLE_PLAYLIST = Path(__file__).resolve().parent.parent / "sample_data" / "sample_playlist_1"
+
+
+class TestSamplePlaylistMatch:
+    """Match sample_playlist_1 against a small synthesized library"""
+
+    @pytest.fixture
+    def playlist_data(self):
+        """Parsed sample playlist (31 tracks, two by NewDad)"""
+        with open(SAMPLE_PLAYLIST, "r", encoding="utf-8") as f:
+            return json.load(f)
 
-# Test the function
-# MODIFY: Update these paths to match your library location
-# Example: If library is at /Volumes/Music Library, use that path
-#          If library is at /Users/username/Music/Library, use base_folder="/Users/username" and library_subpath="Music/Library"
-result = match_playlist_to_library(
-    data=playlist_data,
-    base_folder="/path/to/your/library",  # MODIFY: Update this path
-    library_subpath="",  # MODIFY: Update if needed
-    include_candidates=True,
-    max_candidates=5,
-)
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Library holding a few of the sample tracks, in the naming styles the matcher handles.
 
-# Print summary
-print("=" * 60)
-print("MATCHING SUMMARY")
-print("=" * 60)
-print(f"Library root: {result['summary']['library_root']}")
-print(f"Total tracks: {result['summary']['total_tracks']}")
-print(f"Found: {result['summary']['found']}")
-print(f"Missing: {result['summary']['missing']}")
-print()
+        MODIFY THIS: Add files here to test other tracks from the sample playlist
+        """
+        files = [
+            "NewDad/MADRA/01 Angel.flac",                 # track number prefix
+            "NewDad/MADRA/NewDad - Nosebleed.mp3",        # artist prefix in filename
+            "Frankie Cosmos/Different Talking/Vanity.m4a",
+            "NewDad/MADRA/Other Song.mp3",                # candidate only
+            "Imogen Heap/Speak for Yourself/Goodnight Sweetheart Tonight.mp3",  # candidate for "Goodnight and Go"
+            "Imogen Heap/Speak for Yourself/Headlock.mp3",  # shares no words with any playlist title
+        ]
+        for rel in files:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        return tmp_path
 
-# Print NewDad tracks specifically
-print("=" * 60)
-print("NEWDAD TRACKS (should have matches)")
-print("=" * 60)
-for track in result['results']:
-    if track['artist'].lower() == 'newdad':
-        print(f"\nTime: {track['time']}")
-        print(f"Artist: {track['artist']}")
-        print(f"Album: {track['album']}")
-        print(f"Song: {track['song']}")
-        print(f"Status: {track['match_status']}")
-        if track['matched_paths']:
-            print(f"Matched paths:")
-            for path in track['matched_paths']:
-                print(f"  - {path}")
-        if track.get('candidate_paths'):
-            print(f"Candidate paths:")
-            for path in track['candidate_paths']:
-                print(f"  - {path}")
-        print()
+    def test_match_sample_playlist(self, playlist_data, library):
+        """Test that library tracks are found and everything else is reported missing"""
+        result = match_playlist_to_library(
+            data=playlist_data,
+            base_folder=str(library),
+            library_subpath="",
+            include_candidates=True,
+            max_candidates=5,
+        )
 
-# Print all found tracks
-print("=" * 60)
-print("ALL FOUND TRACKS")
-print("=" * 60)
-found_tracks = [t for t in result['results'] if t['match_status'] == 'found']
-for track in found_tracks:
-    print(f"{track['artist']} - {track['song']} ({track['album']})")
-    for path in track['matched_paths']:
-        print(f"  -> {path}")
-    print()
+        summary = result["summary"]
+        assert summary["total_tracks"] == len(playlist_data["tracks"])
+        assert summary["found"] == 3
+        assert summary["missing"] == summary["total_tracks"] - 3
 
+        found = {t["song"]: t["matched_paths"] for t in result["results"] if t["match_status"] == "found"}
+        assert set(found) == {"Angel", "Nosebleed", "Vanity"}
+        assert [Path(p).name for p in found["Angel"]] == ["01 Angel.flac"]
+        assert [Path(p).name for p in found["Nosebleed"]] == ["NewDad - Nosebleed.mp3"]
 
+    def test_match_sample_playlist_missing_tracks_have_candidates(self, playlist_data, library):
+        """Test that a missing track is offered the similar file from its album, and only that"""
+        result = match_playlist_to_library(
+            data=playlist_data,
+            base_folder=str(library),
+            library_subpath="",
+            include_candidates=True,
+        )
 
+        missing = {t["song"]: t["candidate_paths"] for t in result["results"] if t["match_status"] == "missing"}
+        assert [Path(p).name for p in missing["Goodnight and Go"]] == ["Goodnight Sweetheart Tonight.mp3"]
+        # No other missing track shares an (artist, album) folder with the library
+        assert all(paths == [] for song, paths in missing.items() if song != "Goodnight and Go")
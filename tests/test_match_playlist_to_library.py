@@ -6,14 +6,16 @@ To run specific test: pytest test_match_playlist_to_library.py::test_norm_basic
 """
 
 import tempfile
-import shutil
 from pathlib import Path
 import pytest
 
 from match_playlist_to_library import (
     _norm,
     _iter_audio_files,
+    _list_audio_files,
     _build_index,
+    _strip_parentheticals,
+    _strip_track_number,
     match_playlist_to_library,
     AUDIO_EXTS,
 )
@@ -65,6 +67,23 @@ class TestNormFunction:
         assert result == "song remix"
 
 
+class TestStripHelpers:
+    """Tests for the track-number and parenthetical scanners"""
+
+    def test_strip_track_number(self):
+        """Test that leading track numbers are removed"""
+        assert _strip_track_number("01. Track Name") == "Track Name"
+        assert _strip_track_number("1 Track Name") == "Track Name"
+        assert _strip_track_number("1999") == "1999"
+        assert _strip_track_number("7.5 Seconds") == "7.5 Seconds"
+
+    def test_strip_parentheticals(self):
+        """Test that (...) and [...] groups are removed"""
+        assert _strip_parentheticals("Dancing (2020 Version)") == "Dancing"
+        assert _strip_parentheticals("Song [Remix] (Live) Edit") == "Song Edit"
+        assert _strip_parentheticals("Unclosed (paren") == "Unclosed (paren"
+
+
 class TestIterAudioFiles:
     """Tests for _iter_audio_files function"""
 
@@ -96,6 +115,38 @@ class TestIterAudioFiles:
             assert len(files) == 1
             assert files[0].name == "song.mp3"
 
+    def test_iter_audio_files_skips_hidden_and_system_dirs(self):
+        """Test that hidden/system folders and AppleDouble files are pruned"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            album_dir = tmp_path / "Artist" / "Album"
+            album_dir.mkdir(parents=True)
+            (album_dir / "song.mp3").touch()
+            (album_dir / "._song.mp3").touch()
+            (album_dir / ".hidden.mp3").touch()
+            for skipped in (".git", ".Trashes", "@eaDir", "__MACOSX"):
+                (tmp_path / skipped).mkdir()
+                (tmp_path / skipped / "song.mp3").touch()
+
+            files = list(_iter_audio_files(tmp_path))
+            assert [f.name for f in files] == ["song.mp3"]
+            assert _list_audio_files(tmp_path) == files
+
+    def test_iter_audio_files_keeps_dot_artist_folders(self):
+        """Test that artist folders starting with "." are still walked"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            for artist in (".38 Special", "...And You Will Know Us by the Trail of Dead"):
+                (tmp_path / artist / "Album").mkdir(parents=True)
+                (tmp_path / artist / "Album" / "song.mp3").touch()
+
+            files = list(_iter_audio_files(tmp_path))
+            assert sorted(f.parent.parent.name for f in files) == [
+                "...And You Will Know Us by the Trail of Dead",
+                ".38 Special",
+            ]
+            assert sorted(_list_audio_files(tmp_path)) == sorted(files)
+
     def test_iter_audio_files_all_extensions(self):
         """Test that all supported audio extensions are found"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -108,6 +159,22 @@ class TestIterAudioFiles:
             files = list(_iter_audio_files(tmp_path))
             assert len(files) == 5
 
+    def test_list_audio_files_matches_iter_order(self):
+        """Test that the threaded walk returns the same files in the same order"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / "loose.mp3").touch()
+            for artist in ("B Artist", "A Artist", "C Artist"):
+                album_dir = tmp_path / artist / "Album"
+                album_dir.mkdir(parents=True)
+                (album_dir / "song.flac").touch()
+                (album_dir / "cover.jpg").touch()
+
+            files = _list_audio_files(tmp_path)
+            assert files == list(_iter_audio_files(tmp_path))
+            assert len(files) == 4
+            assert _list_audio_files(tmp_path, max_workers=1) == files
+
 
 class TestBuildIndex:
     """Tests for _build_index function"""
@@ -161,6 +228,44 @@ class TestBuildIndex:
             key = (_norm("ARTIST"), _norm("album"), _norm("SONG"))
             assert key in index
 
+    def test_build_index_lists_each_file_once_per_key(self):
+        """Test that overlapping alternative keys don't list a file twice"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            album_dir = tmp_path / "Artist" / "Album - EP"
+            album_dir.mkdir(parents=True)
+            (album_dir / "01. Song.mp3").touch()
+
+            index = _build_index(tmp_path)
+            key = (_norm("Artist"), _norm("Album"), _norm("Song"))
+            assert key in index
+            assert all(len(paths) == 1 for paths in index.values())
+
+    def test_build_index_parallel_matches_serial(self, monkeypatch):
+        """Test that sharding across worker processes builds the same index"""
+        import match_playlist_to_library as mod
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            for artist in ("Artist A", "Artist B"):
+                album_dir = tmp_path / artist / "Album - EP"
+                album_dir.mkdir(parents=True)
+                (album_dir / "01. Song (Live).mp3").touch()
+                (album_dir / f"{artist} - Other Song.flac").touch()
+
+            serial = _build_index(tmp_path)
+            monkeypatch.setattr(mod, "INDEX_PARALLEL_MIN_FILES", 1)
+            monkeypatch.setattr(mod, "INDEX_WORKERS", 2)
+            assert _build_index(tmp_path) == serial
+
+            # parallel=False (background warm-up) must not start any pool
+            def no_pool(*args, **kwargs):
+                raise AssertionError("parallel=False started a pool")
+
+            monkeypatch.setattr(mod, "ProcessPoolExecutor", no_pool)
+            monkeypatch.setattr(mod, "ThreadPoolExecutor", no_pool)
+            assert _build_index(tmp_path, parallel=False) == serial
+
 
 class TestMatchPlaylistToLibrary:
     """Tests for match_playlist_to_library function"""
@@ -193,24 +298,22 @@ class TestMatchPlaylistToLibrary:
         }
 
     @pytest.fixture
-    def temp_library(self):
-        """Create a temporary library structure for testing.
+    def temp_library(self, shared_library):
+        """Library with Test Artist/Test Album/Test Song.mp3 (shared, built once per session).
         
-        MODIFY THIS: Change the library structure to test different scenarios
+        MODIFY THIS: Change shared_library in conftest.py to test different scenarios
         """
-        tmpdir = tempfile.mkdtemp()
-        tmp_path = Path(tmpdir)
-        
-        # Create library structure: Artist/Album/Track.ext
-        artist_dir = tmp_path / "Test Artist"
-        album_dir = artist_dir / "Test Album"
-        album_dir.mkdir(parents=True)
-        (album_dir / "Test Song.mp3").touch()
-        
-        yield tmp_path
-        
-        # Cleanup
-        shutil.rmtree(tmpdir)
+        return shared_library
+
+    @pytest.fixture
+    def forbid_index_build(self, monkeypatch):
+        """Make any library index build fail the test."""
+        import match_playlist_to_library as mod
+
+        def fail_build_index(_root, **_kwargs):
+            raise AssertionError("index should not be built")
+
+        monkeypatch.setattr(mod, "_build_index", fail_build_index)
 
     def test_match_playlist_exact_match(self, sample_playlist_data, temp_library):
         """Test exact matching of tracks"""
@@ -338,7 +441,7 @@ class TestMatchPlaylistToLibrary:
         if "candidate_paths" in track:
             assert len(track["candidate_paths"]) <= 2
 
-    def test_match_playlist_empty_tracks(self, temp_library):
+    def test_match_playlist_empty_tracks(self, temp_library, forbid_index_build):
         """Test with empty tracks list"""
         playlist_data = {
             "meta": {},
@@ -355,6 +458,93 @@ class TestMatchPlaylistToLibrary:
         assert result["summary"]["found"] == 0
         assert result["summary"]["missing"] == 0
 
+    def test_match_playlist_reuses_index_cache(self, tmp_path, index_cache_dir, request):
+        """Test that the cached index is reused until the library layout changes"""
+        # This test adds a file, so it gets its own library
+        temp_library = tmp_path / "library"
+        (temp_library / "Test Artist" / "Test Album").mkdir(parents=True)
+        (temp_library / "Test Artist" / "Test Album" / "Test Song.mp3").touch()
+
+        playlist_data = {
+            "meta": {},
+            "tracks": [{"artist": "Test Artist", "song": "01. Test Song", "release": "Test Album"}],
+        }
+        first = match_playlist_to_library(playlist_data, base_folder=str(temp_library), library_subpath="")
+        assert first["summary"]["found"] == 1
+        # The cache lives in the per-user cache folder, never in the library itself
+        assert len(list(index_cache_dir.glob("index-*.json"))) == 1
+        assert sorted(p.name for p in temp_library.iterdir()) == ["Test Artist"]
+
+        # From here on the index must come from the cache
+        request.getfixturevalue("forbid_index_build")
+        second = match_playlist_to_library(playlist_data, base_folder=str(temp_library), library_subpath="")
+        assert second["results"] == first["results"]
+
+        # Adding a file invalidates the cache
+        (temp_library / "Test Artist" / "Test Album" / "New Song.mp3").touch()
+        with pytest.raises(AssertionError, match="should not be built"):
+            match_playlist_to_library(playlist_data, base_folder=str(temp_library), library_subpath="")
+
+    def test_match_playlist_finds_every_file_for_the_track(self, tmp_path):
+        """Test that an exact Artist/Album/Title.ext file does not hide other files for the same track"""
+        album_dir = tmp_path / "Artist" / "Album"
+        album_dir.mkdir(parents=True)
+        (album_dir / "Song.mp3").touch()
+        (album_dir / "01. Song.flac").touch()
+
+        playlist_data = {
+            "meta": {},
+            "tracks": [{"artist": "Artist", "song": "Song", "release": "Album"}],
+        }
+        result = match_playlist_to_library(playlist_data, base_folder=str(tmp_path), library_subpath="")
+        names = sorted(Path(p).name for p in result["results"][0]["matched_paths"])
+        assert names == ["01. Song.flac", "Song.mp3"]
+
+    def test_match_playlist_candidate_ranking_rapidfuzz(self, tmp_path, monkeypatch):
+        """Test that rapidfuzz ranks candidates like the token-overlap fallback"""
+        pytest.importorskip("rapidfuzz")
+        import match_playlist_to_library as mod
+
+        album_dir = tmp_path / "Artist" / "Album"
+        album_dir.mkdir(parents=True)
+        for stem in (
+            "Alpha November Oscar Papa Quebec Romeo",      # 1 shared token
+            "Sierra Tango Uniform Victor Whiskey Yankee",  # none
+            "Alpha Bravo Charlie Golf Hotel India",        # 3 shared tokens
+            "Alpha Bravo Juliet Kilo Lima Mike",           # 2 shared tokens
+        ):
+            (album_dir / f"{stem}.mp3").touch()
+        playlist_data = {
+            "meta": {},
+            "tracks": [{"artist": "Artist", "song": "Alpha Bravo Charlie Delta Echo Foxtrot", "release": "Album"}],
+        }
+
+        def candidate_stems(max_candidates):
+            result = match_playlist_to_library(
+                playlist_data,
+                base_folder=str(tmp_path),
+                library_subpath="",
+                include_candidates=True,
+                max_candidates=max_candidates,
+            )
+            track = result["results"][0]
+            assert track["match_status"] == "missing"
+            return [Path(p).stem for p in track["candidate_paths"]]
+
+        assert mod.RAPIDFUZZ_AVAILABLE
+        ranked = candidate_stems(5)
+        top_two = candidate_stems(2)
+        assert ranked == [
+            "Alpha Bravo Charlie Golf Hotel India",
+            "Alpha Bravo Juliet Kilo Lima Mike",
+            "Alpha November Oscar Papa Quebec Romeo",
+        ]
+        assert top_two == ranked[:2]
+
+        monkeypatch.setattr(mod, "RAPIDFUZZ_AVAILABLE", False)
+        assert candidate_stems(5) == ranked
+        assert candidate_stems(2) == top_two
+
     def test_match_playlist_missing_fields(self, temp_library):
         """Test handling of missing track fields"""
         playlist_data = {
@@ -382,6 +572,24 @@ class TestMatchPlaylistToLibrary:
         # Should handle missing fields gracefully
         assert result["summary"]["total_tracks"] == 2
 
+    def test_match_playlist_blank_rows_skip_index(self, temp_library, forbid_index_build):
+        """Test that rows without artist or song are reported missing without indexing"""
+        playlist_data = {
+            "meta": {},
+            "tracks": [{"artist": None, "song": "", "release": "Test Album"}],
+        }
+
+        result = match_playlist_to_library(
+            playlist_data,
+            base_folder=str(temp_library),
+            library_subpath="",
+            use_index_cache=False,
+        )
+
+        assert result["summary"]["missing"] == 1
+        assert result["results"][0]["match_status"] == "missing"
+        assert result["results"][0]["candidate_paths"] == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
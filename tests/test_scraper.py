@@ -9,6 +9,7 @@ import json
 from unittest.mock import Mock, patch
 from bs4 import BeautifulSoup
 import pytest
+import requests
 
 from scraper import _txt, _first, playlist_scraper
 
@@ -47,6 +48,14 @@ class TestHelperFunctions:
         assert el is not None
         assert el.get_text() == "First"
 
+    def test_first_prefers_selector_order_over_document_order(self):
+        """Test _first honors selector priority when a later selector matches earlier in the page"""
+        soup = BeautifulSoup(
+            "<div><p class='b'>Second choice</p><p class='a'>First choice</p></div>", "html.parser"
+        )
+        el = _first(soup, [".a", ".b"])
+        assert el.get_text() == "First choice"
+
     def test_first_returns_none_if_no_match(self):
         """Test _first returns None if no selectors match"""
         soup = BeautifulSoup("<div><p>Text</p></div>", "html.parser")
@@ -94,12 +103,19 @@ class TestPlaylistScraper:
         """
 
     @pytest.fixture
-    def mock_response(self, sample_html):
+    def make_response(self):
+        """Factory for mock HTTP responses (spec'd like requests.Response)"""
+        def _make(text=""):
+            mock = Mock(spec=requests.Response)
+            mock.text = text
+            mock.raise_for_status = Mock()
+            return mock
+        return _make
+
+    @pytest.fixture
+    def mock_response(self, make_response, sample_html):
         """Mock HTTP response with sample HTML"""
-        mock = Mock()
-        mock.text = sample_html
-        mock.raise_for_status = Mock()
-        return mock
+        return make_response(sample_html)
 
     @patch("scraper.requests.get")
     def test_playlist_scraper_basic(self, mock_get, mock_response, sample_html):
@@ -136,7 +152,7 @@ class TestPlaylistScraper:
         assert track1["label"] == "Test Label"
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_with_links(self, mock_get):
+    def test_playlist_scraper_with_links(self, mock_get, make_response):
         """Test scraping tracks with artist/song links"""
         html = """
         <html>
@@ -150,9 +166,7 @@ class TestPlaylistScraper:
         </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.text = html
-        mock_response.raise_for_status = Mock()
+        mock_response = make_response(html)
         mock_get.return_value = mock_response
 
         result = playlist_scraper("https://test.com")
@@ -161,7 +175,7 @@ class TestPlaylistScraper:
         assert track["song_url"] == "/song/456"
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_empty_tracks(self, mock_get):
+    def test_playlist_scraper_empty_tracks(self, mock_get, make_response):
         """Test scraping page with no tracks"""
         html = """
         <html>
@@ -171,9 +185,7 @@ class TestPlaylistScraper:
         </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.text = html
-        mock_response.raise_for_status = Mock()
+        mock_response = make_response(html)
         mock_get.return_value = mock_response
 
         result = playlist_scraper("https://test.com")
@@ -181,7 +193,7 @@ class TestPlaylistScraper:
         assert result["meta"]["track_count"] == 0
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_filters_empty_rows(self, mock_get):
+    def test_playlist_scraper_filters_empty_rows(self, mock_get, make_response):
         """Test that rows without artist or song are filtered out"""
         html = """
         <html>
@@ -200,16 +212,14 @@ class TestPlaylistScraper:
         </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.text = html
-        mock_response.raise_for_status = Mock()
+        mock_response = make_response(html)
         mock_get.return_value = mock_response
 
         result = playlist_scraper("https://test.com")
         assert len(result["tracks"]) == 1
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_normalizes_empty_strings(self, mock_get):
+    def test_playlist_scraper_normalizes_empty_strings(self, mock_get, make_response):
         """Test that empty strings are normalized to None"""
         html = """
         <html>
@@ -225,9 +235,7 @@ class TestPlaylistScraper:
         </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.text = html
-        mock_response.raise_for_status = Mock()
+        mock_response = make_response(html)
         mock_get.return_value = mock_response
 
         result = playlist_scraper("https://test.com")
@@ -236,9 +244,9 @@ class TestPlaylistScraper:
         assert track["label"] is None
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_http_error(self, mock_get):
+    def test_playlist_scraper_http_error(self, mock_get, make_response):
         """Test that HTTP errors are raised"""
-        mock_response = Mock()
+        mock_response = make_response()
         mock_response.raise_for_status.side_effect = Exception("404 Not Found")
         mock_get.return_value = mock_response
 
@@ -246,11 +254,9 @@ class TestPlaylistScraper:
             playlist_scraper("https://test.com")
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_timeout(self, mock_get):
+    def test_playlist_scraper_timeout(self, mock_get, make_response):
         """Test timeout parameter"""
-        mock_response = Mock()
-        mock_response.text = "<html><body></body></html>"
-        mock_response.raise_for_status = Mock()
+        mock_response = make_response("<html><body></body></html>")
         mock_get.return_value = mock_response
 
         # MODIFY THIS: Change timeout value to test different timeouts
@@ -260,7 +266,7 @@ class TestPlaylistScraper:
         assert call_kwargs["timeout"] == 60
 
     @patch("scraper.requests.get")
-    def test_playlist_scraper_fallback_parsing(self, mock_get):
+    def test_playlist_scraper_fallback_parsing(self, mock_get, make_response):
         """Test fallback parsing when no row containers are found"""
         html = """
         <html>
@@ -273,9 +279,7 @@ class TestPlaylistScraper:
         </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.text = html
-        mock_response.raise_for_status = Mock()
+        mock_response = make_response(html)
         mock_get.return_value = mock_response
 
         result = playlist_scraper("https://test.com")